@@ -0,0 +1,70 @@
+"""Attendance table size and scan speed: Enum string vs integer status code.
+
+    python bench/attendance_storage.py --rows 1000000
+
+Builds a synthetic attendance table in the old layout, measures it, applies
+the same batched conversion as migration 8a4d0b6e3c91 and measures again.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+
+BATCH_SIZE = 20000
+
+
+def measure(conn, path, label, present):
+    conn.execute("VACUUM")
+    start = time.perf_counter()
+    for _ in range(5):
+        count = conn.execute("SELECT COUNT(*) FROM attendance WHERE status = ?", (present,)).fetchone()[0]
+    scan = (time.perf_counter() - start) / 5
+    print(f"{label:8} size {os.path.getsize(path) / 1024 / 1024:7.1f} MiB   scan {scan * 1000:6.1f} ms   ({count} present)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), 'attendance.db')
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("""CREATE TABLE attendance (
+        id INTEGER NOT NULL, class_id INTEGER, date DATE, student_id INTEGER,
+        status VARCHAR(7) NOT NULL, PRIMARY KEY (id))""")
+
+    rng = random.Random(7)
+    start_day = date(2024, 1, 8)
+    rows = ((rng.randrange(1500), (start_day + timedelta(days=rng.randrange(120))).isoformat(),
+             rng.randrange(20000), 'present' if rng.random() < 0.93 else 'absent')
+            for _ in range(args.rows))
+    conn.execute("BEGIN")
+    conn.executemany("INSERT INTO attendance (class_id, date, student_id, status) VALUES (?, ?, ?, ?)", rows)
+    conn.execute("COMMIT")
+    measure(conn, path, 'before', 'present')
+
+    start = time.perf_counter()
+    conn.execute("BEGIN")
+    conn.execute("ALTER TABLE attendance ADD COLUMN status_code SMALLINT")
+    max_id = conn.execute("SELECT MAX(id) FROM attendance").fetchone()[0] or 0
+    for lo in range(0, max_id + 1, BATCH_SIZE):
+        conn.execute("UPDATE attendance SET status_code = CASE status WHEN 'present' THEN 1 ELSE 0 END "
+                     "WHERE id >= ? AND id < ?", (lo, lo + BATCH_SIZE))
+    # what batch_alter_table does on SQLite: copy into a new table and swap
+    conn.execute("""CREATE TABLE _alembic_tmp_attendance (
+        id INTEGER NOT NULL, class_id INTEGER, date DATE, student_id INTEGER,
+        status SMALLINT NOT NULL, PRIMARY KEY (id))""")
+    conn.execute("INSERT INTO _alembic_tmp_attendance (id, class_id, date, student_id, status) "
+                 "SELECT id, class_id, date, student_id, status_code FROM attendance")
+    conn.execute("DROP TABLE attendance")
+    conn.execute("ALTER TABLE _alembic_tmp_attendance RENAME TO attendance")
+    conn.execute("COMMIT")
+    print(f"migrate  {time.perf_counter() - start:.1f} s")
+    measure(conn, path, 'after', 1)
+
+
+if __name__ == '__main__':
+    main()
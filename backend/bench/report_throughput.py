@@ -0,0 +1,107 @@
+"""Term report throughput over a synthetic school.
+
+    python bench/report_throughput.py --students 10000 --workers 1 4 8
+
+Creates the schema from the models in a throwaway SQLite file, fills it
+with students, enrollments, assignments, grades and attendance, then times
+load_term() and write_reports() for each format and worker count.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WORDS = ['potion', 'essay', 'charm', 'transfiguration', 'herbology', 'practical', 'theory', 'history',
+         'defence', 'dark', 'arts', 'creatures', 'astronomy', 'chart', 'runes', 'translation', 'review']
+
+
+def populate(path, args, rng):
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO user (id, username, password_hash, full_name, role) VALUES (?, ?, 'x', ?, 'student')",
+        ((i, f"student{i}", f"Student Number {i}") for i in range(1, args.students + 1)))
+    conn.executemany("INSERT INTO class (id, class_code) VALUES (?, ?)",
+                     ((i, f"C{i:04d}") for i in range(1, args.classes + 1)))
+
+    term_start = date(2026, 9, 1)
+    days = [term_start + timedelta(days=d) for d in range(0, 110) if (term_start + timedelta(days=d)).weekday() < 5]
+    assignment_ids = {}
+    rows = []
+    for class_id in range(1, args.classes + 1):
+        ids = []
+        for n in range(args.assignments):
+            assignment_id = len(rows) + 1
+            due = term_start + timedelta(days=(n * 110) // args.assignments)
+            rows.append((assignment_id, " ".join(rng.sample(WORDS, 3)).title(), f"{due} 09:00:00.000000", class_id))
+            ids.append(assignment_id)
+        assignment_ids[class_id] = ids
+    conn.executemany("INSERT INTO assignment (id, title, due_date, class_id) VALUES (?, ?, ?, ?)", rows)
+
+    enrollments, grades, attendance = [], [], []
+    for student_id in range(1, args.students + 1):
+        for class_id in rng.sample(range(1, args.classes + 1), args.per_student):
+            enrollments.append((student_id, class_id))
+            for assignment_id in assignment_ids[class_id]:
+                if rng.random() < 0.9:
+                    grades.append((assignment_id, student_id, round(rng.uniform(40, 100), 1)))
+            for day in days[::5]:
+                attendance.append((class_id, day.isoformat(), student_id, 1 if rng.random() < 0.93 else 0))
+    conn.executemany("INSERT INTO student_class (student_id, class_id) VALUES (?, ?)", enrollments)
+    conn.executemany("INSERT INTO grade (assignment_id, student_id, score) VALUES (?, ?, ?)", grades)
+    conn.executemany("INSERT INTO attendance (class_id, date, student_id, status) VALUES (?, ?, ?, ?)", attendance)
+    conn.commit()
+    conn.close()
+    return len(enrollments), len(grades), len(attendance)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--students', type=int, default=10000)
+    parser.add_argument('--classes', type=int, default=400)
+    parser.add_argument('--per-student', type=int, default=8)
+    parser.add_argument('--assignments', type=int, default=20, help="per class")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count()])
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, 'reports.db')
+    os.environ['DATABASE_URL'] = f"sqlite:///{path}"
+
+    from app import create_app
+    from extensions import db
+    from reports import FORMATS, load_term, write_reports
+
+    app = create_app(blueprints=())
+    with app.app_context():
+        db.create_all()
+
+    start = time.perf_counter()
+    enrollments, grades, attendance = populate(path, args, random.Random(5))
+    print(f"{args.students} students, {enrollments} enrollments, {grades} grades, "
+          f"{attendance} attendance rows ({time.perf_counter() - start:.1f} s)")
+
+    with app.app_context():
+        start = time.perf_counter()
+        reports = load_term(db.session, date(2026, 9, 1), date(2026, 12, 20))
+        load = time.perf_counter() - start
+        db.session.remove()
+    print(f"load_term        {load:6.2f} s")
+
+    for fmt in FORMATS:
+        for workers in args.workers:
+            out = os.path.join(workdir, f"reports-{fmt}-{workers}.zip")
+            start = time.perf_counter()
+            written = write_reports(reports, out, fmt, "2026-09-01 to 2026-12-20", workers)
+            elapsed = time.perf_counter() - start
+            print(f"{fmt:4} workers={workers:<3} {elapsed:6.2f} s  {written / (load + elapsed) * 60:8.0f} reports/min "
+                  f"incl. load  ({os.path.getsize(out) / 1024 / 1024:.1f} MiB zip)")
+
+
+if __name__ == '__main__':
+    main()
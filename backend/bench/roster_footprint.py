@@ -0,0 +1,48 @@
+"""Memory footprint and lookup cost of the roster snapshot.
+
+    python bench/roster_footprint.py --enrollments 50000
+
+Builds a synthetic roster (no database needed) and reports the snapshot size
+and the time of a membership check.
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from roster import RosterSnapshot
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--enrollments', type=int, default=50000)
+    parser.add_argument('--classes', type=int, default=1500)
+    parser.add_argument('--teachers', type=int, default=400)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    students = max(args.enrollments // 6, 1)
+    student_pairs = set()
+    while len(student_pairs) < args.enrollments:
+        student_pairs.add((rng.randrange(students), rng.randrange(args.classes)))
+    teacher_pairs = [(rng.randrange(args.teachers), class_id) for class_id in range(args.classes)]
+
+    snapshot = RosterSnapshot()
+    build = timeit.timeit(lambda: snapshot.load(teacher_pairs, student_pairs), number=1)
+    stats = snapshot.stats()
+
+    probes = [(rng.randrange(students), rng.randrange(args.classes)) for _ in range(10000)]
+    lookup = timeit.timeit(lambda: [snapshot.is_enrolled(s, c) for s, c in probes], number=10)
+
+    print(f"enrollments      {stats['enrollments']}")
+    print(f"teacher links    {stats['teacher_links']}")
+    print(f"build            {build * 1000:.1f} ms")
+    print(f"footprint        {stats['bytes'] / 1024 / 1024:.2f} MiB")
+    print(f"is_enrolled      {lookup / (10 * len(probes)) * 1e9:.0f} ns/lookup")
+
+
+if __name__ == '__main__':
+    main()
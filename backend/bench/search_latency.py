@@ -0,0 +1,95 @@
+"""Search latency over a synthetic school of 100k users.
+
+    python bench/search_latency.py --users 100000
+
+Creates the source tables and search_index (with its triggers) in a
+throwaway SQLite file, inserts users, classes and assignments through the
+triggers, then times representative queries for each role.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from search import create_search_index, search
+
+FIRST = ['Harry', 'Hermione', 'Ron', 'Luna', 'Neville', 'Ginny', 'Draco', 'Cho', 'Cedric', 'Padma',
+         'Parvati', 'Dean', 'Seamus', 'Lavender', 'Hannah', 'Ernie', 'Susan', 'Terry', 'Michael', 'Anthony']
+LAST = ['Potter', 'Granger', 'Weasley', 'Lovegood', 'Longbottom', 'Malfoy', 'Chang', 'Diggory', 'Patil',
+        'Thomas', 'Finnigan', 'Brown', 'Abbott', 'Macmillan', 'Bones', 'Boot', 'Corner', 'Goldstein']
+WORDS = ['potion', 'essay', 'charm', 'transfiguration', 'herbology', 'practical', 'theory', 'history',
+         'defence', 'dark', 'arts', 'creatures', 'astronomy', 'chart', 'runes', 'translation', 'review']
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--classes', type=int, default=2000)
+    parser.add_argument('--assignments', type=int, default=20000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), 'search.db')
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE user (id INTEGER PRIMARY KEY, username VARCHAR(50), password_hash VARCHAR(255),
+                           full_name VARCHAR(100), role VARCHAR(7));
+        CREATE TABLE class (id INTEGER PRIMARY KEY, class_code VARCHAR(10), deleted_at TIMESTAMP);
+        CREATE TABLE assignment (id INTEGER PRIMARY KEY, title VARCHAR(100), description TEXT,
+                                 due_date TIMESTAMP, class_id INTEGER, deleted_at TIMESTAMP);
+    """)
+    conn.commit()
+    conn.close()
+
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        create_search_index(connection)
+
+    rng = random.Random(3)
+    conn = sqlite3.connect(path)
+    start = time.perf_counter()
+    conn.executemany(
+        "INSERT INTO user (username, password_hash, full_name, role) VALUES (?, 'x', ?, ?)",
+        ((f"user{i}", f"{rng.choice(FIRST)} {rng.choice(LAST)}", 'student' if i % 20 else 'teacher')
+         for i in range(args.users)))
+    conn.executemany("INSERT INTO class (class_code) VALUES (?)", ((f"C{i:05d}",) for i in range(args.classes)))
+    conn.executemany(
+        "INSERT INTO assignment (title, description, class_id) VALUES (?, ?, ?)",
+        ((" ".join(rng.sample(WORDS, 3)).title(), " ".join(rng.choices(WORDS, k=30)), rng.randrange(1, args.classes))
+         for _ in range(args.assignments)))
+    conn.commit()
+    conn.close()
+    rows = args.users + args.classes + args.assignments
+    print(f"indexed {rows} rows through triggers in {time.perf_counter() - start:.1f} s")
+
+    student_classes = rng.sample(range(1, args.classes), 6)
+    cases = [
+        ('admin', 'granger', ()),
+        ('admin', 'her gra', ()),
+        ('admin', 'user4242', ()),
+        ('teacher', 'potter', ()),
+        ('teacher', 'potion essay', ()),
+        ('student', 'potion', student_classes),
+        ('admin', 'po', ()),
+    ]
+    with Session(engine) as session:
+        for role, q, class_ids in cases:
+            search(session, q, role, class_ids)
+            timings = []
+            for _ in range(20):
+                start = time.perf_counter()
+                hits, _ = search(session, q, role, class_ids)
+                timings.append(time.perf_counter() - start)
+            timings.sort()
+            print(f"{role:8} {q!r:16} p50 {timings[10] * 1000:6.2f} ms  p95 {timings[18] * 1000:6.2f} ms  {len(hits)} hits")
+
+
+if __name__ == '__main__':
+    main()
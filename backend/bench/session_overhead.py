@@ -0,0 +1,61 @@
+"""Per-request auth overhead: signed cookie sessions vs server-side sessions.
+
+    python bench/session_overhead.py --requests 2000
+
+Runs against a throwaway SQLite database. Each variant logs in once and
+then issues authenticated GETs; the difference is the cost of opening and
+saving the session plus load_user.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    from flask.sessions import SecureCookieSessionInterface
+    from sessions import MemorySessionStore, ServerSideSessionInterface
+    from app import create_app
+    from extensions import db
+    from models import User
+
+    app = create_app()
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(username='admin', password_hash='secret', full_name='Admin', role='admin'))
+        db.session.commit()
+
+    variants = [
+        ('signed cookie', SecureCookieSessionInterface()),
+        ('server-side (sqlite)', app.session_interface),
+        ('server-side (memory)', ServerSideSessionInterface(MemorySessionStore())),
+    ]
+    for label, interface in variants:
+        app.session_interface = interface
+        client = app.test_client()
+        client.post('/api/login', json={'username': 'admin', 'password': 'secret'})
+        # warm up caches and the connection pool
+        for _ in range(50):
+            client.get('/api/roster/stats')
+
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            response = client.get('/api/roster/stats')
+        elapsed = time.perf_counter() - start
+        assert response.status_code == 200, response.status_code
+        print(f"{label:22} {elapsed / args.requests * 1e6:7.0f} us/request")
+
+
+if __name__ == '__main__':
+    main()
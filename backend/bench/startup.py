@@ -0,0 +1,114 @@
+"""Startup cost: import time and time to first request.
+
+    python bench/startup.py              # print the numbers
+    python bench/startup.py --record     # also append them to startup_history.jsonl
+
+Each measurement runs in a fresh interpreter. Import time comes from
+`python -X importtime` (cumulative microseconds of the top-level module);
+time to first request covers import, create_app() and one GET through the
+test client.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY = os.path.join(BACKEND, 'bench', 'startup_history.jsonl')
+
+FIRST_REQUEST = """
+import time
+start = time.perf_counter()
+import app as module
+imported = time.perf_counter()
+flask_app = module.create_app()
+created = time.perf_counter()
+response = flask_app.test_client().get('/api/hello')
+assert response.status_code == 200, response.status_code
+done = time.perf_counter()
+print(imported - start, created - imported, done - created)
+"""
+
+SETUP = """
+from app import create_app
+from extensions import db
+with create_app(blueprints=()).app_context():
+    db.create_all()
+"""
+
+LEAN_IMPORT = """
+import time
+start = time.perf_counter()
+import app as module
+module.create_app(blueprints=())
+print(time.perf_counter() - start)
+"""
+
+
+def run(code, env, args=()):
+    return subprocess.run([sys.executable, *args, '-c', code], cwd=BACKEND, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def import_time_us(env, module):
+    result = run(f"import {module}", env, ['-X', 'importtime'])
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [part.strip() for part in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"no importtime line for {module}")
+
+
+def measured_commit():
+    """HEAD, marked -dirty when the tree has uncommitted changes (those are what gets measured)."""
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=BACKEND, capture_output=True, text=True).stdout.strip()
+    commit = git('rev-parse', '--short', 'HEAD')
+    return commit + '-dirty' if git('status', '--porcelain', '--', '.') else commit
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--record', action='store_true')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'startup.db')}"
+
+    run(SETUP, env)
+
+    imports, first = [], []
+    lean = []
+    for _ in range(args.runs):
+        imports.append(import_time_us(env, 'app'))
+        first.append([float(x) for x in run(FIRST_REQUEST, env).stdout.split()])
+        lean.append(float(run(LEAN_IMPORT, env).stdout))
+
+    result = {
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': measured_commit(),
+        'import_app_ms': round(median(imports) / 1000, 1),
+        'app_without_routes_ms': round(median(lean) * 1000, 1),
+        'first_request_ms': round(median([sum(r) for r in first]) * 1000, 1),
+        'create_app_ms': round(median([r[1] for r in first]) * 1000, 1),
+    }
+    for key, value in result.items():
+        print(f"{key:24} {value}")
+
+    if args.record:
+        with open(HISTORY, 'a') as history:
+            history.write(json.dumps(result) + "\n")
+
+
+if __name__ == '__main__':
+    main()
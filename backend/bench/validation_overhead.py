@@ -0,0 +1,73 @@
+"""Cost of @validate_json on the bulk endpoints.
+
+    python bench/validation_overhead.py --users 1000
+
+Compares parsing a create_users body on its own against parsing plus
+schema validation, and times how quickly an oversized or malformed body
+is turned away through the full Flask request path.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validation import compile_schema
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+
+    from app import create_app
+    from extensions import db
+    from schemas import USERS_SCHEMA
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+
+    users = [
+        {'username': f'student{i}', 'password': 'secret', 'full_name': f'Student Number {i}', 'role': 'student'}
+        for i in range(args.users)
+    ]
+    body = json.dumps({'users': users})
+    validator = compile_schema(USERS_SCHEMA)
+
+    def parse_only():
+        return json.loads(body)
+
+    def parse_and_validate():
+        errors = []
+        validator(json.loads(body), errors)
+        return errors
+
+    parse = timeit.timeit(parse_only, number=args.repeat) / args.repeat
+    full = timeit.timeit(parse_and_validate, number=args.repeat) / args.repeat
+    print(f"body             {len(body) / 1024:.1f} KiB, {args.users} users")
+    print(f"parse            {parse * 1000:.2f} ms")
+    print(f"parse+validate   {full * 1000:.2f} ms  (+{(full - parse) / parse * 100:.0f}%)")
+
+    client = app.test_client()
+    oversized = b'{"users": [' + b' ' * (2 * 1024 * 1024) + b']}'
+    malformed = json.dumps({'users': [{'username': 1}] * args.users})
+
+    reject_size = timeit.timeit(
+        lambda: client.post('/api/create_users', data=oversized, content_type='application/json'),
+        number=args.repeat) / args.repeat
+    reject_schema = timeit.timeit(
+        lambda: client.post('/api/create_users', data=malformed, content_type='application/json'),
+        number=args.repeat) / args.repeat
+    print(f"reject 2 MiB     {reject_size * 1000:.2f} ms/request")
+    print(f"reject invalid   {reject_schema * 1000:.2f} ms/request")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,14 @@
+# Route modules, imported and registered by create_app only when asked for.
+# Each one exposes a Blueprint named `bp`. POTTER_BLUEPRINTS picks a subset
+# (comma separated); empty or `none` registers no routes at all.
+BLUEPRINTS = (
+    'auth',
+    'users',
+    'classes',
+    'assignments',
+    'attendance',
+    'rosters',
+    'discovery',
+    'sync',
+    'ops',
+)
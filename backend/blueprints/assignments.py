@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta
+
+from flask import Blueprint, abort, jsonify, request
+from flask_login import current_user, login_required
+
+from extensions import db, write_limiter
+from models import Assignment
+from ratelimit import limit_concurrency
+from roster import roster
+from schemas import ASSIGNMENT_SCHEMA, ASSIGNMENT_UPDATE_SCHEMA
+from validation import parse_timestamp, validate_json
+
+
+bp = Blueprint('assignments', __name__)
+
+
+##########################################################
+#              API CALLS FOR ASSIGNMENTS                #
+##########################################################
+# CREATE Assignment
+@bp.route('/api/assignments', methods=['POST'])
+@login_required
+@validate_json(ASSIGNMENT_SCHEMA)
+@limit_concurrency(write_limiter)
+def create_assignment():
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        data = request.get_json()
+        title = data.get('title')
+        description = data.get('description')
+        due_date_str = data.get('due_date')
+        class_id = data.get('class_id')
+
+        # Convert the string to a datetime object
+        due_date = parse_timestamp(due_date_str)
+
+
+        new_assignment = Assignment(title=title, description=description, due_date=due_date, class_id=class_id)
+        db.session.add(new_assignment)
+        db.session.commit()
+
+        return jsonify({"message": "Assignment created successfully"}), 201
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can create assignments."})
+
+
+
+@bp.route('/api/assignments', methods=['GET'])
+@login_required
+def get_assignments():
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        assignments = Assignment.live().all()
+        assignment_list = [{'id': a.id, 'title': a.title, 'description': a.description, 'due_date': a.due_date, 'class_id': a.class_id} for a in assignments]
+        return jsonify({'assignments': assignment_list})
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can view assignments."})
+
+# Upcoming assignments, soonest first
+@bp.route('/api/assignments/upcoming', methods=['GET'])
+@login_required
+def get_upcoming_assignments():
+    try:
+        start = parse_timestamp(request.args['from']) if 'from' in request.args else datetime.utcnow()
+        end = parse_timestamp(request.args['to']) if 'to' in request.args else start + timedelta(days=30)
+    # OverflowError: an offset at either end of the range, or a default
+    # 'to' past the year 9999
+    except (ValueError, OverflowError):
+        abort(400, {"error": "'from' and 'to' must be ISO 8601 datetimes."})
+    class_id = request.args.get('class_id', type=int)
+    limit = min(max(request.args.get('limit', 100, type=int), 1), 500)
+
+    roster.ensure_loaded(db.session)
+    if class_id is not None:
+        if current_user.role == 'student' and not roster.is_enrolled(current_user.id, class_id):
+            abort(403, {"error": "Permission denied. You are not enrolled in this class."})
+        class_ids = [class_id]
+    elif current_user.role == 'teacher':
+        class_ids = roster.classes_for_teacher(current_user.id)
+    elif current_user.role == 'student':
+        class_ids = roster.classes_for_student(current_user.id)
+    else:
+        class_ids = None
+
+    query = Assignment.live().filter(Assignment.due_date >= start, Assignment.due_date < end)
+    if class_ids is not None:
+        query = query.filter(Assignment.class_id.in_(class_ids))
+    assignments = query.order_by(Assignment.due_date, Assignment.id).limit(limit).all()
+
+    assignment_list = [{'id': a.id, 'title': a.title, 'description': a.description, 'due_date': a.due_date.isoformat(), 'class_id': a.class_id} for a in assignments]
+    return jsonify({'assignments': assignment_list, 'from': start.isoformat(), 'to': end.isoformat()})
+
+# READ Specific Assignment
+@bp.route('/api/assignments/<int:assignment_id>', methods=['GET'])
+@login_required
+def get_assignment(assignment_id):
+    assignment = Assignment.get_live(assignment_id)
+    if not assignment:
+        abort(404, {"error": "Assignment not found."})
+
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        return jsonify({'id': assignment.id, 'title': assignment.title, 'description': assignment.description, 'due_date': assignment.due_date, 'class_id': assignment.class_id})
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can view assignments."})
+
+# UPDATE Assignment
+@bp.route('/api/assignments/<int:assignment_id>', methods=['PUT'])
+@login_required
+@validate_json(ASSIGNMENT_UPDATE_SCHEMA)
+@limit_concurrency(write_limiter)
+def update_assignment(assignment_id):
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        assignment = Assignment.get_live(assignment_id)
+        if not assignment:
+            abort(404, {"error": "Assignment not found."})
+
+        data = request.get_json()
+        assignment.title = data.get('title', assignment.title)
+        assignment.description = data.get('description', assignment.description)
+        if 'due_date' in data:
+            assignment.due_date = parse_timestamp(data['due_date']) if data['due_date'] else None
+        assignment.class_id = data.get('class_id', assignment.class_id)
+
+        db.session.commit()
+
+        return jsonify({"message": "Assignment updated successfully"})
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can update assignments."})
+
+# DELETE Assignment
+@bp.route('/api/assignments/<int:assignment_id>', methods=['DELETE'])
+@login_required
+@limit_concurrency(write_limiter)
+def delete_assignment(assignment_id):
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        assignment = Assignment.get_live(assignment_id)
+        if not assignment:
+            abort(404, {"error": "Assignment not found."})
+
+        assignment.soft_delete()
+        db.session.commit()
+
+        return jsonify({"message": "Assignment deleted successfully"})
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can delete assignments."})
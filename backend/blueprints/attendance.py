@@ -0,0 +1,106 @@
+from datetime import datetime
+
+from flask import Blueprint, abort, jsonify, request
+from flask_login import current_user, login_required
+
+from extensions import db, write_limiter
+from models import ATTENDANCE_STATUS_CODES, Attendance
+from ratelimit import limit_concurrency
+from roster import roster
+from schemas import ATTENDANCE_SCHEMA, ATTENDANCE_UPDATE_SCHEMA
+from validation import validate_json
+
+
+bp = Blueprint('attendance', __name__)
+
+
+###############################################################################################
+#           CRUD FOR ATTENDANCE
+################################################################################
+
+# GET all attendance records
+@bp.route('/api/attendance', methods=['GET'])
+@login_required
+def get_attendance():
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        attendance_records = Attendance.live().all()
+        return jsonify({'attendance': [a.__repr__() for a in attendance_records]})
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can view attendance records."})
+
+# GET specific attendance record
+@bp.route('/api/attendance/<int:attendance_id>', methods=['GET'])
+@login_required
+def get_specific_attendance(attendance_id):
+    attendance_record = Attendance.get_live(attendance_id)
+    if attendance_record:
+        if current_user.role == 'admin' or current_user.role == 'teacher':
+            return jsonify(attendance_record.__repr__())
+        else:
+            abort(403, {"error": "Permission denied. Only admins and teachers can view attendance records."})
+    else:
+        abort(404, {"error": "Attendance record not found."})
+
+# POST attendance record
+@bp.route('/api/attendance', methods=['POST'])
+@login_required
+@validate_json(ATTENDANCE_SCHEMA)
+@limit_concurrency(write_limiter)
+def create_attendance():
+    if current_user.role == 'teacher':
+        data = request.get_json()
+        class_id = data.get('class_id')
+        student_id = data.get('student_id')
+        date_str = data.get('date')
+        status = data.get('status')
+
+        date = datetime.fromisoformat(date_str).date() if date_str else None
+
+        # Check if the teacher is assigned to the specified class
+        roster.ensure_loaded(db.session)
+        if not roster.verify_teaches(db.session, current_user.id, class_id):
+            abort(403, {"error": "Permission denied. You are not assigned to this class."})
+
+        new_attendance = Attendance(class_id=class_id, student_id=student_id, date=date, status=ATTENDANCE_STATUS_CODES[status])
+        db.session.add(new_attendance)
+        db.session.commit()
+
+        return jsonify({"message": "Attendance record created successfully"}), 201
+    else:
+        abort(403, {"error": "Permission denied. Only teachers can create attendance records."})
+
+# UPDATE attendance record
+@bp.route('/api/attendance/<int:attendance_id>', methods=['PUT'])
+@login_required
+@validate_json(ATTENDANCE_UPDATE_SCHEMA)
+@limit_concurrency(write_limiter)
+def update_attendance(attendance_id):
+    if current_user.role == 'teacher':
+        attendance_record = Attendance.get_live(attendance_id)
+        if attendance_record:
+            data = request.get_json()
+            attendance_record.status = ATTENDANCE_STATUS_CODES[data.get('status')]
+            db.session.commit()
+
+            return jsonify({"message": "Attendance record updated successfully"})
+        else:
+            abort(404, {"error": "Attendance record not found."})
+    else:
+        abort(403, {"error": "Permission denied. Only teachers can update attendance records."})
+
+# DELETE attendance record
+@bp.route('/api/attendance/<int:attendance_id>', methods=['DELETE'])
+@login_required
+@limit_concurrency(write_limiter)
+def delete_attendance(attendance_id):
+    if current_user.role == 'teacher':
+        attendance_record = Attendance.get_live(attendance_id)
+        if attendance_record:
+            attendance_record.soft_delete()
+            db.session.commit()
+
+            return jsonify({"message": "Attendance record deleted successfully"})
+        else:
+            abort(404, {"error": "Attendance record not found."})
+    else:
+        abort(403, {"error": "Permission denied. Only teachers can delete attendance records."})
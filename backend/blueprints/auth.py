@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from flask import Blueprint, abort, current_app, jsonify, request
+from flask_login import current_user, login_required, login_user, logout_user
+
+from extensions import login_ip_limiter, login_user_limiter
+from models import User
+from ratelimit import rate_limit
+from schemas import LOGIN_SCHEMA, REVOKE_SESSIONS_SCHEMA
+from validation import validate_json
+
+
+bp = Blueprint('auth', __name__)
+
+
+###########################################################
+#   LOGIN AND LOGOUT
+##########################################################
+@bp.route('/api/login', methods=['POST'])
+@rate_limit(login_ip_limiter, lambda: request.remote_addr)
+@validate_json(LOGIN_SCHEMA, max_bytes=1024)
+@rate_limit(login_user_limiter, lambda: request.get_json()['username'].lower())
+def login():
+    data = request.get_json()
+    username = data.get('username')
+    password = data.get('password')
+
+    user = User.query.filter_by(username=username).first()
+
+    if user and user.password_hash == password:
+        login_user(user)
+        return jsonify({"message": "Login successful"}), 200
+    else:
+        return jsonify({"error": "Invalid username or password"}), 401
+
+
+@bp.route('/api/logout', methods=['POST'])
+@login_required
+def logout():
+    logout_user()
+    return jsonify({"message": "Logout successful"}), 200
+
+
+
+@bp.route('/api/profile')
+@login_required
+def profile():
+    # Print assigned classes for debugging
+    print("Assigned Classes:", current_user.teacher_classes)
+    return jsonify({"username": current_user.username, "role": current_user.role})
+
+
+# List active sessions
+@bp.route('/api/sessions', methods=['GET'])
+@login_required
+def get_sessions():
+    if current_user.role != 'admin':
+        abort(403, {"error": "Permission denied. Only admins can access this information."})
+
+    sessions = current_app.session_interface.store.active(datetime.utcnow())
+    session_list = [{'session': sid[:8], 'user_id': user_id, 'expires_at': expires_at} for sid, user_id, expires_at in sessions]
+    return jsonify({'sessions': session_list})
+
+# Revoke every session of a user
+@bp.route('/api/sessions/revoke', methods=['POST'])
+@login_required
+@validate_json(REVOKE_SESSIONS_SCHEMA, max_bytes=1024)
+def revoke_sessions():
+    if current_user.role != 'admin':
+        abort(403, {"error": "Permission denied. Only admins can revoke sessions."})
+
+    data = request.get_json()
+    revoked = current_app.session_interface.revoke_user(data.get('user_id'))
+    return jsonify({"message": "Sessions revoked successfully", "revoked": revoked})
@@ -0,0 +1,144 @@
+from datetime import timezone
+
+from flask import Blueprint, Response, abort, jsonify, request, stream_with_context
+from flask_login import current_user, login_required
+from sqlalchemy import func
+
+from extensions import db, write_limiter
+from ical import render_calendar
+from models import Assignment, Class
+from ratelimit import limit_concurrency
+from roster import roster
+from schemas import CLASS_SCHEMA
+from validation import validate_json
+
+
+bp = Blueprint('classes', __name__)
+
+
+#################################################
+#       CRUD FOR CLASSES ALL API CALLS
+################################################
+
+#gett all
+@bp.route('/api/classes', methods=['GET'])
+@login_required
+def get_classes():
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        classes = Class.live().all()
+        return jsonify({'classes': [c.__repr__() for c in classes]}), 200
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can view classes."})
+
+# GET SPECIFIC
+@bp.route('/api/classes/<int:class_id>', methods=['GET'])
+@login_required
+def get_class(class_id):
+    class_instance = Class.get_live(class_id)
+    if class_instance:
+        if current_user.role == 'admin' or current_user.role == 'teacher':
+            return jsonify(class_instance.__repr__())
+        else:
+            abort(403, {"error": "Permission denied. Only admins and teachers can view classes."})
+    else:
+        abort(404, {"error": "Class not found."})
+
+
+#POST ONE
+@bp.route('/api/classes', methods=['POST'])
+@login_required
+@validate_json(CLASS_SCHEMA)
+@limit_concurrency(write_limiter)
+def create_class():
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        data = request.get_json()
+        class_code = data.get('class_code')
+        if Class.live().filter_by(class_code=class_code).first():
+            abort(400, {"error": "Class code already in use."})
+
+        new_class = Class(class_code=class_code)
+        db.session.add(new_class)
+        db.session.commit()
+
+        return jsonify({"message": "Class created successfully"}), 201
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can create classes."})
+
+#EDIT ONE SPECIFIC
+@bp.route('/api/classes/<int:class_id>', methods=['PUT'])
+@login_required
+@validate_json(CLASS_SCHEMA)
+@limit_concurrency(write_limiter)
+def update_class(class_id):
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        class_instance = Class.get_live(class_id)
+        if class_instance:
+            data = request.get_json()
+            class_code = data.get('class_code')
+            if Class.live().filter(Class.class_code == class_code, Class.id != class_id).first():
+                abort(400, {"error": "Class code already in use."})
+            class_instance.class_code = class_code
+            db.session.commit()
+
+            return jsonify({"message": "Class updated successfully"})
+        else:
+            abort(404, {"error": "Class not found."})
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can update classes."})
+
+#DELETE CLASS
+@bp.route('/api/classes/<int:class_id>', methods=['DELETE'])
+@login_required
+@limit_concurrency(write_limiter)
+def delete_class(class_id):
+    if current_user.role == 'admin' or current_user.role == 'teacher':
+        class_instance = Class.get_live(class_id)
+        if class_instance:
+            class_instance.soft_delete()
+            db.session.commit()
+            roster.remove_class(class_id)
+
+            return jsonify({"message": "Class deleted successfully"})
+        else:
+            abort(404, {"error": "Class not found."})
+    else:
+        abort(403, {"error": "Permission denied. Only admins and teachers can delete classes."})
+
+
+
+# iCalendar feed of a class's assignments, streamed, with conditional GET
+@bp.route('/api/classes/<int:class_id>/calendar.ics', methods=['GET'])
+@login_required
+def get_class_calendar(class_id):
+    class_instance = Class.get_live(class_id)
+    if not class_instance:
+        abort(404, {"error": "Class not found."})
+    if current_user.role == 'student':
+        roster.ensure_loaded(db.session)
+        if not roster.is_enrolled(current_user.id, class_id):
+            abort(403, {"error": "Permission denied. You are not enrolled in this class."})
+
+    class_code = class_instance.class_code
+    # Tombstones count for Last-Modified: a delete only stamps the deleted
+    # row, so the live rows' newest updated_at would not move. The live
+    # count in the ETag catches an assignment moved to another class.
+    last_modified, count = db.session.query(
+        func.max(Assignment.updated_at),
+        func.count(Assignment.id).filter(Assignment.deleted_at.is_(None)),
+    ).filter(Assignment.class_id == class_id).one()
+
+    def generate():
+        rows = db.session.execute(
+            db.select(Assignment.id, Assignment.title, Assignment.description, Assignment.due_date, Assignment.updated_at)
+            .where(Assignment.class_id == class_id, Assignment.due_date.isnot(None), Assignment.deleted_at.is_(None))
+            .order_by(Assignment.due_date)
+            .execution_options(yield_per=500)
+        )
+        yield from render_calendar(class_code, rows, host=request.host)
+
+    response = Response(stream_with_context(generate()), mimetype='text/calendar')
+    response.headers['Content-Disposition'] = f'attachment; filename="{class_code}.ics"'
+    if last_modified is not None:
+        response.last_modified = last_modified.replace(tzinfo=timezone.utc)
+    response.set_etag(f"{class_id}-{count}-{last_modified.isoformat() if last_modified else ''}")
+    return response.make_conditional(request)
@@ -0,0 +1,34 @@
+from flask import Blueprint, abort, jsonify, request
+from flask_login import current_user, login_required
+
+from extensions import db
+from roster import roster
+from search import search
+
+
+bp = Blueprint('discovery', __name__)
+
+
+#################################################
+#       SEARCH
+################################################
+
+@bp.route('/api/search', methods=['GET'])
+@login_required
+def search_all():
+    q = request.args.get('q', '')
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', 20, type=int)
+    if not q.strip():
+        abort(400, {"error": "Query parameter 'q' is required."})
+    if page < 1 or not 1 <= per_page <= 100:
+        abort(400, {"error": "'page' must be at least 1 and 'per_page' between 1 and 100."})
+
+    class_ids = ()
+    if current_user.role == 'student':
+        roster.ensure_loaded(db.session)
+        class_ids = roster.classes_for_student(current_user.id)
+
+    results, has_more = search(db.session, q, current_user.role, class_ids,
+                               limit=per_page, offset=(page - 1) * per_page)
+    return jsonify({'results': results, 'page': page, 'per_page': per_page, 'has_more': has_more})
@@ -0,0 +1,65 @@
+import sys
+import time
+
+import click
+from flask import Blueprint, current_app, jsonify
+
+from extensions import db
+from ratelimit import render_metrics
+
+
+# cli_group=None puts the commands at the top level: `flask sweep-sessions`
+bp = Blueprint('ops', __name__, cli_group=None)
+
+
+# Limiter counters in the Prometheus text format
+@bp.route('/api/metrics', methods=['GET'])
+def metrics():
+    return render_metrics(), 200, {'Content-Type': 'text/plain; version=0.0.4'}
+
+
+@bp.route('/api/hello')
+def hello():
+    return jsonify(message = 'hellow Word')
+
+
+@bp.cli.command('sweep-sessions')
+def sweep_sessions():
+    """Delete expired server-side sessions."""
+    removed = current_app.session_interface.sweep()
+    click.echo(f"Removed {removed} expired sessions")
+
+
+# reports.FORMATS, spelled out so this module does not import reports
+@bp.cli.command('term-reports')
+@click.option('--out', required=True, type=click.Path(dir_okay=False, allow_dash=True),
+              help="Zip file to write, or - for stdout.")
+@click.option('--format', 'fmt', type=click.Choice(('html', 'csv')), default='html', show_default=True)
+@click.option('--start', type=click.DateTime(['%Y-%m-%d']), help="First day of the term.")
+@click.option('--end', type=click.DateTime(['%Y-%m-%d']), help="Last day of the term.")
+@click.option('--workers', type=int, help="Render processes, default one per CPU.")
+def term_reports(out, fmt, start, end, workers):
+    """Write a report per student (grades and attendance) into a zip."""
+    # imported here so web workers never load the report engine
+    from reports import load_term, write_reports
+
+    start = start.date() if start else None
+    end = end.date() if end else None
+    if start and end:
+        term = f"{start} to {end}"
+    elif start or end:
+        term = f"From {start}" if start else f"Until {end}"
+    else:
+        term = "All terms"
+
+    began = time.perf_counter()
+    reports = load_term(db.session, start, end)
+    # the workers never touch the database
+    db.session.remove()
+    loaded = time.perf_counter()
+
+    target = sys.stdout.buffer if out == '-' else out
+    written = write_reports(reports, target, fmt, term, workers)
+    elapsed = time.perf_counter() - began
+    click.echo(f"Wrote {written} {fmt} reports to {out} in {elapsed:.1f} s "
+               f"(loading {loaded - began:.1f} s, {written / elapsed * 60:.0f} reports/min)", err=True)
@@ -0,0 +1,152 @@
+from flask import Blueprint, abort, jsonify, request
+from flask_login import current_user, login_required
+
+from extensions import db, write_limiter
+from models import Class, StudentClass, TeacherClass, User
+from ratelimit import limit_concurrency
+from roster import roster
+from schemas import STUDENT_CLASS_SCHEMA, TEACHER_CLASS_SCHEMA
+from validation import validate_json
+
+
+bp = Blueprint('rosters', __name__)
+
+
+###########################################
+        # Teahc and class assignments
+#  STUDNET ASSIGNMENT TO CLASSES        
+ ##################################
+
+@bp.route('/api/get_classes_and_teachers', methods=['GET'])
+@login_required
+def get_classes_and_teachers():
+    if current_user.role != 'admin':
+        abort(403, {"error": "Permission denied. Only admins can view classes and teachers."})
+
+    classes_and_teachers = []
+
+    # Retrieve all classes
+    classes = Class.live().all()
+    for class_obj in classes:
+        class_info = {
+            'class_id': class_obj.id,
+            'class_code': class_obj.class_code,
+            'teachers': []
+        }
+
+        # Retrieve teachers assigned to the class
+        teacher_assignments = TeacherClass.query.filter_by(class_id=class_obj.id).all()
+        for assignment in teacher_assignments:
+            teacher_info = {
+                'teacher_id': assignment.teacher.id,
+                'teacher_username': assignment.teacher.username,
+                'teacher_full_name': assignment.teacher.full_name
+            }
+            class_info['teachers'].append(teacher_info)
+
+        classes_and_teachers.append(class_info)
+
+    return jsonify({"classes_and_teachers": classes_and_teachers})
+
+
+
+@bp.route('/api/assign_teacher_to_class', methods=['POST'])
+@login_required
+@validate_json(TEACHER_CLASS_SCHEMA, max_bytes=1024)
+@limit_concurrency(write_limiter)
+def assign_teacher_to_class():
+    if current_user.role != 'admin':
+        abort(403, {"error": "Permission denied. Only admins can assign teachers to classes."})
+
+    data = request.get_json()
+    teacher_id = data.get('teacher_id')
+    class_id = data.get('class_id')
+
+    # Check if both teacher and class exist
+    teacher = User.query.get(teacher_id)
+    class_obj = Class.get_live(class_id)
+
+    if not teacher or not class_obj:
+        abort(404, {"error": "Teacher or class not found."})
+
+    # Check if the teacher is already assigned to the class
+    roster.ensure_loaded(db.session)
+    if roster.verify_teaches(db.session, teacher.id, class_obj.id):
+        return jsonify({"message": "Teacher already assigned to the class."})
+
+    # Assign the teacher to the class
+    new_assignment = TeacherClass(teacher=teacher, class_obj=class_obj)
+    db.session.add(new_assignment)
+    db.session.commit()
+    roster.add_teacher(teacher.id, class_obj.id)
+
+    return jsonify({"message": "Teacher assigned to the class successfully."})
+
+
+@bp.route('/api/assign_student_to_class', methods=['POST'])
+@login_required
+@validate_json(STUDENT_CLASS_SCHEMA, max_bytes=1024)
+@limit_concurrency(write_limiter)
+def assign_student_to_class():
+    if current_user.role != 'admin':
+        abort(403, {"error": "Permission denied. Only admins can assign students to classes."})
+
+    data = request.get_json()
+    student_id = data.get('student_id')
+    class_id = data.get('class_id')
+
+    # Add logic to check if the student and class exist
+
+    # Create a new record in the StudentClass table
+    new_student_class = StudentClass(student_id=student_id, class_id=class_id)
+    db.session.add(new_student_class)
+    db.session.commit()
+    roster.ensure_loaded(db.session)
+    roster.add_student(student_id, class_id)
+    return jsonify({"message": "Student assigned to class successfully"}), 201
+
+
+@bp.route('/api/get_students_and_classes', methods=['GET'])
+@login_required
+def get_students_and_classes():
+    if current_user.role != 'admin':
+        abort(403, {"error": "Permission denied. Only admins can access this information."})
+
+    # Query all students and their assigned classes
+    students = User.query.filter_by(role='student').all()
+
+    student_info = []
+    for student in students:
+        assigned_classes = []
+        student_classes = StudentClass.query.filter_by(student_id=student.id).all()
+        for student_class in student_classes:
+            if student_class.class_obj.deleted_at is not None:
+                continue
+            class_info = {
+                "class_id": student_class.class_obj.id,
+                "class_code": student_class.class_obj.class_code
+            }
+            assigned_classes.append(class_info)
+
+        student_data = {
+            "id": student.id,
+            "full_name": student.full_name,
+            "role": student.role,
+            "username": student.username,
+            "assigned_classes": assigned_classes
+        }
+        student_info.append(student_data)
+
+    return jsonify({"students": student_info})
+
+
+
+# Roster snapshot size, so the in-memory footprint can be watched
+@bp.route('/api/roster/stats', methods=['GET'])
+@login_required
+def get_roster_stats():
+    if current_user.role != 'admin':
+        abort(403, {"error": "Permission denied. Only admins can access this information."})
+
+    roster.ensure_loaded(db.session)
+    return jsonify(roster.stats())
@@ -0,0 +1,44 @@
+from flask import Blueprint, abort, jsonify, request
+from flask_login import current_user, login_required
+
+from changes import InvalidToken, collect_changes
+from models import Assignment, Attendance, Class
+
+
+bp = Blueprint('sync', __name__)
+
+
+#################################################
+#       CHANGE FEED
+################################################
+
+def serialize_class(c):
+    return {'id': c.id, 'class_code': c.class_code}
+
+def serialize_assignment(a):
+    return {'id': a.id, 'title': a.title, 'description': a.description, 'due_date': a.due_date.isoformat() if a.due_date else None, 'class_id': a.class_id}
+
+def serialize_attendance(a):
+    return {'id': a.id, 'class_id': a.class_id, 'student_id': a.student_id, 'date': a.date.isoformat() if a.date else None, 'status': a.status_name}
+
+# (kind, type name, model, serializer); kind orders rows that share an updated_at
+CHANGE_FEEDS = [
+    (1, 'class', Class, serialize_class),
+    (2, 'assignment', Assignment, serialize_assignment),
+    (3, 'attendance', Attendance, serialize_attendance),
+]
+
+@bp.route('/api/changes', methods=['GET'])
+@login_required
+def get_changes():
+    if current_user.role != 'admin' and current_user.role != 'teacher':
+        abort(403, {"error": "Permission denied. Only admins and teachers can sync changes."})
+
+    since = request.args.get('since')
+    limit = min(max(request.args.get('limit', 500, type=int), 1), 2000)
+    try:
+        changes, next_token, has_more = collect_changes(CHANGE_FEEDS, since, limit)
+    except InvalidToken:
+        abort(400, {"error": "Invalid 'since' token. Start over without one."})
+
+    return jsonify({'changes': changes, 'next': next_token, 'has_more': has_more})
@@ -0,0 +1,104 @@
+from flask import Blueprint, abort, jsonify, request
+from flask_login import current_user, login_required
+
+from extensions import db, write_limiter
+from models import User
+from ratelimit import limit_concurrency
+from schemas import USER_SCHEMA, USERS_SCHEMA
+from validation import validate_json
+
+
+bp = Blueprint('users', __name__)
+
+
+##########################################################
+#              API CALLS CRUD                            #
+#########################################################
+###########
+
+
+#FOR USER AKA STUDENT/TEACHER
+# SINGLE USER CREATION
+
+@bp.route('/api/create_user', methods=['POST'])
+@login_required
+@validate_json(USER_SCHEMA)
+@limit_concurrency(write_limiter)
+def create_user():
+    print(current_user.role)
+    data = request.get_json()
+
+    username = data.get('username')
+    password = data.get('password')
+    full_name = data.get('full_name')
+    role = data.get('role')
+
+    existing_user = User.query.filter_by(username=username).first()
+    if existing_user:
+        abort(400, {"error": "Username already exists"})
+
+        
+    if current_user.role != 'admin':
+        # Teachers can only create students
+        if role != 'student':
+            abort(403, {"error": "Permission denied. Teachers can only create students."})
+
+    # If the current user is an admin, allow creating any role
+    if role == 'teacher' and current_user.role != 'admin':
+        abort(403, {"error": "Permission denied. Only admins can create teachers."})
+
+
+    new_user = User(username=username, password_hash=password, full_name=full_name, role=role)
+
+    db.session.add(new_user)
+    db.session.commit()
+
+    return jsonify({"message": "User created successfully"}), 201
+
+# MANY USER CREATIONS
+#Require a role privilage refactoring
+
+@bp.route('/api/create_users', methods=['POST'])
+@validate_json(USERS_SCHEMA, max_bytes=1024 * 1024)
+@limit_concurrency(write_limiter)
+def create_users():
+    data = request.get_json()
+
+    users_to_create = data.get('users', [])
+
+    for user_data in users_to_create:
+        username = user_data.get('username')
+        password = user_data.get('password')
+        full_name = user_data.get('full_name')
+        role = user_data.get('role')
+
+        existing_user = User.query.filter_by(username=username).first()
+        if existing_user:
+            abort(400, {"error": f"Username '{username}' already exists"})
+
+        new_user = User(username=username, password_hash=password, full_name=full_name, role=role)
+        db.session.add(new_user)
+
+    db.session.commit()
+
+    return jsonify({"message": "Users created successfully"}), 201
+
+
+#get all users
+
+
+@bp.route('/api/get_users', methods=['GET'])
+def get_users():
+    users = User.query.all()
+
+    user_list = []
+    for user in users:
+        user_info = {
+            'id': user.id,
+            'username': user.username,
+            'full_name': user.full_name,
+            'role': user.role
+        }
+        user_list.append(user_info)
+
+    return jsonify({"users": user_list})
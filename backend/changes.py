@@ -0,0 +1,82 @@
+import base64
+import heapq
+import json
+from datetime import datetime, timedelta
+
+
+###########################################
+##   CHANGE FEED                         ##
+###########################################
+# Rows of the tracked tables carry updated_at (bumped on every write) and
+# deleted_at (a tombstone instead of a hard delete). The feed walks all
+# tracked tables in (updated_at, kind, id) order and hands the client an
+# opaque token for the last row it returned; the next call resumes after
+# it.
+#
+# Rows touched in the last SETTLE_TIME are held back. updated_at is stamped
+# before the commit, so a slow transaction can commit a row whose
+# timestamp is older than rows already handed out. The lag gives such
+# transactions time to land before the feed moves past their timestamp.
+
+SETTLE_TIME = timedelta(seconds=2)
+
+
+class InvalidToken(ValueError):
+    pass
+
+
+def encode_token(updated_at, kind, row_id):
+    raw = json.dumps([updated_at.isoformat(), kind, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_token(token):
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        updated_at, kind, row_id = json.loads(raw)
+        return datetime.fromisoformat(updated_at), int(kind), int(row_id)
+    except (ValueError, TypeError):
+        raise InvalidToken(token)
+
+
+def collect_changes(feeds, since=None, limit=500, now=None):
+    """Changes across feeds after the since token, oldest first.
+
+    feeds is a list of (kind, name, model, serialize) with distinct integer
+    kinds. Returns (changes, next_token, has_more).
+    """
+    until = (now or datetime.utcnow()) - SETTLE_TIME
+    position = decode_token(since) if since else None
+
+    streams = []
+    for kind, name, model, serialize in feeds:
+        query = model.query.filter(model.updated_at.isnot(None), model.updated_at < until)
+        if position is not None:
+            at, after_kind, after_id = position
+            if kind > after_kind:
+                query = query.filter(model.updated_at >= at)
+            elif kind == after_kind:
+                query = query.filter((model.updated_at > at) | ((model.updated_at == at) & (model.id > after_id)))
+            else:
+                query = query.filter(model.updated_at > at)
+        rows = query.order_by(model.updated_at, model.id).limit(limit + 1).all()
+        streams.append([(row.updated_at, kind, row.id, name, row, serialize) for row in rows])
+
+    merged = heapq.merge(*streams, key=lambda entry: entry[:3])
+    changes = []
+    last = None
+    for entry in merged:
+        if len(changes) == limit:
+            return changes, encode_token(*last), True
+        updated_at, kind, row_id, name, row, serialize = entry
+        change = {'type': name, 'id': row_id, 'updated_at': updated_at.isoformat()}
+        if row.deleted_at is not None:
+            change['op'] = 'delete'
+        else:
+            change['op'] = 'upsert'
+            change['data'] = serialize(row)
+        changes.append(change)
+        last = (updated_at, kind, row_id)
+
+    next_token = encode_token(*last) if last else since
+    return changes, next_token, False
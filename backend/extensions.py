@@ -0,0 +1,21 @@
+from flask_cors import CORS
+from flask_login import LoginManager
+from flask_sqlalchemy import SQLAlchemy
+
+from ratelimit import ConcurrencyLimiter, RateLimiter
+
+
+###########################################
+##   EXTENSIONS (bound in create_app)    ##
+###########################################
+# Flask-Migrate is deliberately not here: importing it pulls in Alembic,
+# which only the `flask db` commands need. create_app sets it up on demand.
+
+db = SQLAlchemy()
+login_manager = LoginManager()
+cors = CORS()
+
+login_ip_limiter = RateLimiter('login_ip', 'LOGIN_RATE_LIMIT_PER_IP')
+login_user_limiter = RateLimiter('login_user', 'LOGIN_RATE_LIMIT_PER_USER')
+# SQLite has a single writer, extra concurrent writes would only queue on its lock
+write_limiter = ConcurrencyLimiter('writes', 'WRITE_CONCURRENCY_LIMIT')
@@ -0,0 +1,53 @@
+###########################################
+##   ICALENDAR (RFC 5545) EXPORT         ##
+###########################################
+# Renders assignments as VEVENTs, one line at a time, so a class calendar
+# can be streamed without building the whole document in memory.
+
+PRODID = "-//potterManagement//Assignments//EN"
+
+
+def escape_text(value):
+    return (value or "").replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+def fold(line):
+    """Split a content line into 75-octet pieces joined by CRLF + space."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + "\r\n"
+
+    pieces = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # don't split a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        pieces.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+        limit = 74   # continuation lines start with a space
+    return "\r\n ".join(pieces) + "\r\n"
+
+
+def format_utc(value):
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def render_calendar(name, events, host="potter.local"):
+    """Yield the calendar text for (id, title, description, due_date, updated_at) rows."""
+    yield fold("BEGIN:VCALENDAR")
+    yield fold("VERSION:2.0")
+    yield fold(f"PRODID:{PRODID}")
+    yield fold("CALSCALE:GREGORIAN")
+    yield fold(f"X-WR-CALNAME:{escape_text(name)}")
+    for assignment_id, title, description, due_date, updated_at in events:
+        yield fold("BEGIN:VEVENT")
+        yield fold(f"UID:assignment-{assignment_id}@{host}")
+        yield fold(f"DTSTAMP:{format_utc(updated_at)}")
+        yield fold(f"DTSTART:{format_utc(due_date)}")
+        yield fold(f"SUMMARY:{escape_text(title)}")
+        if description:
+            yield fold(f"DESCRIPTION:{escape_text(description)}")
+        yield fold("END:VEVENT")
+    yield fold("END:VCALENDAR")
@@ -0,0 +1,102 @@
+"""change tracking columns
+
+Revision ID: 1b9d5e7a3c28
+Revises: e5b2c8f14d67
+Create Date: 2026-10-19 18:02:14.309581
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b9d5e7a3c28'
+down_revision = 'e5b2c8f14d67'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 20000
+
+SEARCH_TRIGGERS_BEFORE = [
+    """CREATE TRIGGER search_class_au AFTER UPDATE OF class_code ON class BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 2, new.id, new.class_code, '');
+    END""",
+    """CREATE TRIGGER search_assignment_au AFTER UPDATE OF title, description, class_id ON assignment BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 3, new.class_id, new.title, coalesce(new.description, ''));
+    END""",
+]
+
+# Soft-deleted rows drop out of search_index
+SEARCH_TRIGGERS_AFTER = [
+    """CREATE TRIGGER search_class_au AFTER UPDATE OF class_code, deleted_at ON class BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+        INSERT INTO search_index (rowid, scope, title, body)
+            SELECT new.id * 4 + 2, new.id, new.class_code, '' WHERE new.deleted_at IS NULL;
+    END""",
+    """CREATE TRIGGER search_assignment_au AFTER UPDATE OF title, description, class_id, deleted_at ON assignment BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+        INSERT INTO search_index (rowid, scope, title, body)
+            SELECT new.id * 4 + 3, new.class_id, new.title, coalesce(new.description, '') WHERE new.deleted_at IS NULL;
+    END""",
+]
+
+
+def _stamp(table, where, batched=False):
+    # Bound as a DateTime so the stored text has the same format (with
+    # microseconds) the application writes; the change feed compares it
+    now = sa.bindparam('now', datetime.utcnow(), type_=sa.TIMESTAMP())
+    conn = op.get_bind()
+    if not batched:
+        conn.execute(sa.text(f"UPDATE {table} SET updated_at = :now WHERE {where}").bindparams(now))
+        return
+    max_id = conn.execute(sa.text(f"SELECT MAX(id) FROM {table}")).scalar() or 0
+    for start in range(0, max_id + 1, BATCH_SIZE):
+        conn.execute(
+            sa.text(f"UPDATE {table} SET updated_at = :now WHERE {where} AND id >= :lo AND id < :hi").bindparams(now),
+            {"lo": start, "hi": start + BATCH_SIZE},
+        )
+
+
+def upgrade():
+    # Plain ADD COLUMN throughout: rebuilding class or assignment would drop
+    # their search_index triggers
+    op.add_column('class', sa.Column('updated_at', sa.TIMESTAMP(), nullable=True))
+    op.add_column('class', sa.Column('deleted_at', sa.TIMESTAMP(), nullable=True))
+    op.add_column('assignment', sa.Column('deleted_at', sa.TIMESTAMP(), nullable=True))
+    op.add_column('attendance', sa.Column('updated_at', sa.TIMESTAMP(), nullable=True))
+    op.add_column('attendance', sa.Column('deleted_at', sa.TIMESTAMP(), nullable=True))
+
+    _stamp('class', "updated_at IS NULL")
+    # e5b2c8f14d67 backfilled with CURRENT_TIMESTAMP, which has no fraction
+    _stamp('assignment', "updated_at IS NULL OR updated_at NOT LIKE '%.%'")
+    _stamp('attendance', "updated_at IS NULL", batched=True)
+
+    op.create_index(op.f('ix_class_updated_at'), 'class', ['updated_at'], unique=False)
+    op.create_index(op.f('ix_assignment_updated_at'), 'assignment', ['updated_at'], unique=False)
+    op.create_index(op.f('ix_attendance_updated_at'), 'attendance', ['updated_at'], unique=False)
+
+    op.execute("DROP TRIGGER IF EXISTS search_class_au")
+    op.execute("DROP TRIGGER IF EXISTS search_assignment_au")
+    for statement in SEARCH_TRIGGERS_AFTER:
+        op.execute(statement)
+
+
+def downgrade():
+    op.execute("DROP TRIGGER IF EXISTS search_class_au")
+    op.execute("DROP TRIGGER IF EXISTS search_assignment_au")
+    for statement in SEARCH_TRIGGERS_BEFORE:
+        op.execute(statement)
+
+    op.drop_index(op.f('ix_attendance_updated_at'), table_name='attendance')
+    op.drop_index(op.f('ix_assignment_updated_at'), table_name='assignment')
+    op.drop_index(op.f('ix_class_updated_at'), table_name='class')
+
+    op.drop_column('attendance', 'deleted_at')
+    op.drop_column('attendance', 'updated_at')
+    op.drop_column('assignment', 'deleted_at')
+    op.drop_column('class', 'deleted_at')
+    op.drop_column('class', 'updated_at')
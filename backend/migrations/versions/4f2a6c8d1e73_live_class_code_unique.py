@@ -0,0 +1,69 @@
+"""class_code unique among live classes only
+
+Revision ID: 4f2a6c8d1e73
+Revises: 1b9d5e7a3c28
+Create Date: 2026-10-20 10:12:41.530218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f2a6c8d1e73'
+down_revision = '1b9d5e7a3c28'
+branch_labels = None
+depends_on = None
+
+# Frozen copy of the search_index triggers on class at this revision.
+# Rebuilding the table drops them, so they are created again afterwards.
+CLASS_SEARCH_TRIGGERS = [
+    """CREATE TRIGGER search_class_ai AFTER INSERT ON class BEGIN
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 2, new.id, new.class_code, '');
+    END""",
+    """CREATE TRIGGER search_class_au AFTER UPDATE OF class_code, deleted_at ON class BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+        INSERT INTO search_index (rowid, scope, title, body)
+            SELECT new.id * 4 + 2, new.id, new.class_code, '' WHERE new.deleted_at IS NULL;
+    END""",
+    """CREATE TRIGGER search_class_ad AFTER DELETE ON class BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+    END""",
+]
+
+
+def _class_table(*constraints):
+    return sa.Table(
+        'class', sa.MetaData(),
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('class_code', sa.String(length=10), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), nullable=True),
+        sa.Column('deleted_at', sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index('ix_class_updated_at', 'updated_at'),
+        *constraints,
+    )
+
+
+def _rebuild_class(*constraints):
+    # The table-level UNIQUE(class_code) from the initial migration is
+    # unnamed, so SQLite can only lose it by rebuilding the table. DDL is
+    # not transactional here: clear the copy a failed attempt left behind.
+    op.execute("DROP TABLE IF EXISTS _alembic_tmp_class")
+    with op.batch_alter_table('class', recreate='always', copy_from=_class_table(*constraints)):
+        pass
+    for statement in CLASS_SEARCH_TRIGGERS:
+        op.execute(statement)
+
+
+def upgrade():
+    # A soft-deleted class keeps its row; its code must be free to reuse
+    _rebuild_class()
+    op.create_index('uq_class_class_code_live', 'class', ['class_code'], unique=True,
+                    sqlite_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade():
+    # The partial index goes with the old table. Fails, leaving the table
+    # as it was, if a deleted class shares its code with another class.
+    _rebuild_class(sa.UniqueConstraint('class_code'))
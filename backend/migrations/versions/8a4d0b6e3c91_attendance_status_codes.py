@@ -0,0 +1,52 @@
+"""attendance status as integer code
+
+Revision ID: 8a4d0b6e3c91
+Revises: 5c1e7a9d2f40
+Create Date: 2026-10-19 11:40:08.117254
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4d0b6e3c91'
+down_revision = '5c1e7a9d2f40'
+branch_labels = None
+depends_on = None
+
+# Rows converted per UPDATE, keeps each statement's undo journal small
+BATCH_SIZE = 20000
+
+
+def _convert_in_batches(statement):
+    conn = op.get_bind()
+    max_id = conn.execute(sa.text("SELECT MAX(id) FROM attendance")).scalar() or 0
+    for start in range(0, max_id + 1, BATCH_SIZE):
+        conn.execute(sa.text(statement), {"lo": start, "hi": start + BATCH_SIZE})
+
+
+def upgrade():
+    op.add_column('attendance', sa.Column('status_code', sa.SmallInteger(), nullable=True))
+    _convert_in_batches(
+        "UPDATE attendance SET status_code = CASE status WHEN 'present' THEN 1 ELSE 0 END "
+        "WHERE id >= :lo AND id < :hi"
+    )
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.drop_column('status')
+        batch_op.alter_column('status_code', new_column_name='status',
+               existing_type=sa.SmallInteger(),
+               nullable=False)
+
+
+def downgrade():
+    op.add_column('attendance', sa.Column('status_name', sa.Enum('present', 'absent'), nullable=True))
+    _convert_in_batches(
+        "UPDATE attendance SET status_name = CASE status WHEN 1 THEN 'present' ELSE 'absent' END "
+        "WHERE id >= :lo AND id < :hi"
+    )
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.drop_column('status')
+        batch_op.alter_column('status_name', new_column_name='status',
+               existing_type=sa.Enum('present', 'absent'),
+               nullable=False)
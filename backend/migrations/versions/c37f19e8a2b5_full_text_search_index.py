@@ -0,0 +1,77 @@
+"""full text search index
+
+Revision ID: c37f19e8a2b5
+Revises: 8a4d0b6e3c91
+Create Date: 2026-10-19 14:03:55.802731
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c37f19e8a2b5'
+down_revision = '8a4d0b6e3c91'
+branch_labels = None
+depends_on = None
+
+# Frozen copy of search.SEARCH_INDEX_DDL / SEARCH_INDEX_BACKFILL at this revision
+SEARCH_INDEX_DDL = [
+    """CREATE VIRTUAL TABLE search_index USING fts5(
+        scope UNINDEXED, title, body,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')""",
+    """CREATE TRIGGER search_user_ai AFTER INSERT ON user BEGIN
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 1, new.role, new.full_name, new.username);
+    END""",
+    """CREATE TRIGGER search_user_au AFTER UPDATE OF username, full_name, role ON user BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 1, new.role, new.full_name, new.username);
+    END""",
+    """CREATE TRIGGER search_user_ad AFTER DELETE ON user BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+    END""",
+    """CREATE TRIGGER search_class_ai AFTER INSERT ON class BEGIN
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 2, new.id, new.class_code, '');
+    END""",
+    """CREATE TRIGGER search_class_au AFTER UPDATE OF class_code ON class BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 2, new.id, new.class_code, '');
+    END""",
+    """CREATE TRIGGER search_class_ad AFTER DELETE ON class BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+    END""",
+    """CREATE TRIGGER search_assignment_ai AFTER INSERT ON assignment BEGIN
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 3, new.class_id, new.title, coalesce(new.description, ''));
+    END""",
+    """CREATE TRIGGER search_assignment_au AFTER UPDATE OF title, description, class_id ON assignment BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 3, new.class_id, new.title, coalesce(new.description, ''));
+    END""",
+    """CREATE TRIGGER search_assignment_ad AFTER DELETE ON assignment BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+    END""",
+]
+
+SEARCH_INDEX_BACKFILL = [
+    "INSERT INTO search_index (rowid, scope, title, body) SELECT id * 4 + 1, role, full_name, username FROM user",
+    "INSERT INTO search_index (rowid, scope, title, body) SELECT id * 4 + 2, id, class_code, '' FROM class",
+    "INSERT INTO search_index (rowid, scope, title, body) "
+    "SELECT id * 4 + 3, class_id, title, coalesce(description, '') FROM assignment",
+]
+
+TRIGGERS = [
+    'search_user_ai', 'search_user_au', 'search_user_ad',
+    'search_class_ai', 'search_class_au', 'search_class_ad',
+    'search_assignment_ai', 'search_assignment_au', 'search_assignment_ad',
+]
+
+
+def upgrade():
+    for statement in SEARCH_INDEX_DDL + SEARCH_INDEX_BACKFILL:
+        op.execute(statement)
+
+
+def downgrade():
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS search_index")
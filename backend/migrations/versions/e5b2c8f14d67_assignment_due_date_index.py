@@ -0,0 +1,29 @@
+"""assignment due date index and updated_at
+
+Revision ID: e5b2c8f14d67
+Revises: c37f19e8a2b5
+Create Date: 2026-10-19 16:21:37.640918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b2c8f14d67'
+down_revision = 'c37f19e8a2b5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Plain ADD COLUMN + CREATE INDEX: a batch_alter_table rebuild of
+    # assignment would drop the search_index triggers defined on it
+    op.add_column('assignment', sa.Column('updated_at', sa.TIMESTAMP(), nullable=True))
+    op.execute("UPDATE assignment SET updated_at = CURRENT_TIMESTAMP")
+    op.create_index('ix_assignment_class_id_due_date', 'assignment', ['class_id', 'due_date'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_assignment_class_id_due_date', table_name='assignment')
+    op.drop_column('assignment', 'updated_at')
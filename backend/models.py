@@ -0,0 +1,144 @@
+from datetime import datetime
+
+from flask_login import UserMixin
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, Enum, ForeignKey, Date, TIMESTAMP, Text, Index, text
+from sqlalchemy.orm import relationship
+
+from extensions import db
+
+
+ROLES = ('teacher', 'student', 'admin')
+# Attendance status is stored as a small integer code; the API speaks names
+ATTENDANCE_STATUS_CODES = {'absent': 0, 'present': 1}
+ATTENDANCE_STATUS_NAMES = {code: name for name, code in ATTENDANCE_STATUS_CODES.items()}
+ATTENDANCE_STATUSES = tuple(ATTENDANCE_STATUS_CODES)
+
+class ChangeTracked:
+    """updated_at and a deleted_at tombstone, for the change feed (GET /api/changes)."""
+    updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    deleted_at = Column(TIMESTAMP)
+
+    @classmethod
+    def live(cls):
+        return cls.query.filter(cls.deleted_at.is_(None))
+
+    @classmethod
+    def get_live(cls, row_id):
+        row = db.session.get(cls, row_id)
+        return row if row is not None and row.deleted_at is None else None
+
+    def soft_delete(self):
+        self.deleted_at = datetime.utcnow()
+
+class User(db.Model, UserMixin):
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    username = Column(String(50), unique=True, nullable=False)
+    password_hash = Column(String(255), nullable=False)
+    full_name = Column(String(100), nullable=False)
+    role = Column(Enum(*ROLES), nullable=False)
+
+    # Define relationships
+    teacher_classes = relationship('TeacherClass', back_populates='teacher')
+    student_classes = relationship('StudentClass', back_populates='student')
+    attendances = relationship('Attendance', back_populates='student')
+    grades = relationship('Grade', back_populates='student')
+
+    def __repr__(self):
+        return f"<User(id={self.id}, username={self.username}, role={self.role})>"
+
+class Class(ChangeTracked, db.Model):
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    class_code = Column(String(10), nullable=False)
+
+    # A soft-deleted class keeps its row, so its code is only reserved while it is live
+    __table_args__ = (Index('uq_class_class_code_live', 'class_code', unique=True, sqlite_where=text('deleted_at IS NULL')),)
+
+    # Define relationships
+    assignments = relationship('Assignment', back_populates='class_obj')
+    teacher_classes = relationship('TeacherClass', back_populates='class_obj')
+    student_classes = relationship('StudentClass', back_populates='class_obj')
+    attendances = relationship('Attendance', back_populates='class_obj')
+
+    def __repr__(self):
+        return f"<Class(id={self.id}, class_code={self.class_code})>"
+
+class TeacherClass(db.Model):
+    teacher_id = Column(Integer, ForeignKey('user.id'), primary_key=True)
+    class_id = Column(Integer, ForeignKey('class.id'), primary_key=True)
+
+    # Define relationships
+    teacher = relationship('User', back_populates='teacher_classes')
+    class_obj = relationship('Class', back_populates='teacher_classes')
+
+    def __repr__(self):
+        return f"<TeacherClass(teacher_id={self.teacher_id}, class_id={self.class_id})>"
+
+
+class StudentClass(db.Model):
+    student_id = Column(Integer, ForeignKey('user.id'), primary_key=True)
+    class_id = Column(Integer, ForeignKey('class.id'), primary_key=True)
+
+    # Define relationships
+    student = relationship('User', back_populates='student_classes')
+    class_obj = relationship('Class', back_populates='student_classes')
+
+    def __repr__(self):
+        return f"<StudentClass(student_id={self.student_id}, class_id={self.class_id})>"
+
+
+class Assignment(ChangeTracked, db.Model):
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    title = Column(String(100), nullable=False)
+    description = Column(Text)
+    due_date = Column(TIMESTAMP)
+    class_id = Column(Integer, ForeignKey('class.id'))
+
+    # Upcoming-due lookups walk a class's assignments in due date order
+    __table_args__ = (Index('ix_assignment_class_id_due_date', 'class_id', 'due_date'),)
+
+    # Define relationships
+    class_obj = relationship('Class', back_populates='assignments')
+    grades = relationship('Grade', back_populates='assignment')
+
+    def __repr__(self):
+        return f"<Assignment(id={self.id}, title={self.title}, class_id={self.class_id})>"
+
+class Attendance(ChangeTracked, db.Model):
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    class_id = Column(Integer, ForeignKey('class.id'))
+    date = Column(Date)
+    student_id = Column(Integer, ForeignKey('user.id'))
+    status = Column(SmallInteger, nullable=False)
+
+    # Define relationships
+    class_obj = relationship('Class', back_populates='attendances')
+    student = relationship('User', back_populates='attendances')
+
+    @property
+    def status_name(self):
+        return ATTENDANCE_STATUS_NAMES.get(self.status)
+
+    def __repr__(self):
+        return f"<Attendance(id={self.id}, class_id={self.class_id}, student_id={self.student_id}, status={self.status_name})>"
+
+class Grade(db.Model):
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    assignment_id = Column(Integer, ForeignKey('assignment.id'))
+    student_id = Column(Integer, ForeignKey('user.id'))
+    score = Column(Float, nullable=False)
+
+    # Define relationships
+    assignment = relationship('Assignment', back_populates='grades')
+    student = relationship('User', back_populates='grades')
+
+    def __repr__(self):
+        return f"<Grade(id={self.id}, assignment_id={self.assignment_id}, student_id={self.student_id}, score={self.score})>"
+
+class UserSession(db.Model):
+    id = Column(String(64), primary_key=True)
+    user_id = Column(Integer, ForeignKey('user.id'), index=True)
+    data = Column(Text, nullable=False)
+    expires_at = Column(TIMESTAMP, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<UserSession(user_id={self.user_id}, expires_at={self.expires_at})>"
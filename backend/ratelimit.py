@@ -0,0 +1,198 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, jsonify
+
+
+###########################################
+##   RATE LIMITING AND LOAD SHEDDING     ##
+###########################################
+# Two kinds of admission control, both per worker process:
+#
+#   RateLimiter         token bucket per key (IP, username, ...). Limits are
+#                       written as "<count>/<second|minute|hour>" and read
+#                       from app.config the first time an app uses the
+#                       limiter; each app keeps its own buckets in
+#                       app.extensions['limiters'].
+#   ConcurrencyLimiter  caps how many requests run a guarded route at once.
+#                       Requests over the cap get a 429 straight away
+#                       instead of queueing on the SQLite write lock.
+#
+# Every limiter registers itself so /api/metrics can report its counters.
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600}
+
+limiters = []
+
+
+def parse_rate(value):
+    """'10/minute' -> (tokens per second, burst size)."""
+    count, _, period = value.partition('/')
+    count = int(count)
+    if count <= 0 or period not in PERIODS:
+        raise ValueError(f"Invalid rate limit '{value}'")
+    return count / PERIODS[period], count
+
+
+def too_many_requests(message, retry_after):
+    return jsonify({"error": message}), 429, {'Retry-After': str(max(1, math.ceil(retry_after)))}
+
+
+class _Buckets:
+    """One app's token buckets and counters for a RateLimiter."""
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.allowed = 0
+        self.limited = 0
+        self.buckets = OrderedDict()   # key -> (tokens, last refill), least recently hit first
+        self.lock = threading.Lock()
+
+
+class _InFlight:
+    """One app's in-flight count and counters for a ConcurrencyLimiter."""
+    def __init__(self, limit):
+        self.limit = limit
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+
+
+def _app_state(limiter, build):
+    # Limiters are module-level so views can be decorated at import time;
+    # what they count lives on the app, configured from that app's config
+    states = current_app.extensions.setdefault('limiters', {})
+    state = states.get(limiter.name)
+    if state is None:
+        state = states.setdefault(limiter.name, build(current_app.config[limiter.config_key]))
+    return state
+
+
+class RateLimiter:
+    def __init__(self, name, config_key, max_keys=100000):
+        self.name = name
+        self.config_key = config_key
+        self.max_keys = max_keys
+        limiters.append(self)
+
+    def _state(self):
+        return _app_state(self, lambda value: _Buckets(*parse_rate(value)))
+
+    def hit(self, key):
+        """Take one token for key; returns seconds to wait, or 0 when allowed."""
+        state = self._state()
+        now = time.monotonic()
+        with state.lock:
+            tokens, last = state.buckets.get(key, (state.burst, now))
+            tokens = min(state.burst, tokens + (now - last) * state.rate)
+            if tokens < 1:
+                self._store(state, key, tokens, now)
+                state.limited += 1
+                return (1 - tokens) / state.rate
+
+            self._store(state, key, tokens - 1, now)
+            state.allowed += 1
+            return 0
+
+    def _store(self, state, key, tokens, now):
+        # Keys come from clients (any username can be sent to login), so the
+        # table is capped: past max_keys the least recently hit bucket goes.
+        # That keeps every hit O(1); a bucket untouched the longest is the
+        # one most likely to have refilled anyway.
+        state.buckets[key] = (tokens, now)
+        state.buckets.move_to_end(key)
+        if len(state.buckets) > self.max_keys:
+            state.buckets.popitem(last=False)
+
+    def reset(self):
+        state = self._state()
+        with state.lock:
+            state.buckets.clear()
+
+    def metrics(self):
+        state = self._state()
+        return {
+            'allowed': state.allowed,
+            'limited': state.limited,
+            'tracked_keys': len(state.buckets),
+            'rate_per_second': state.rate,
+            'burst': state.burst,
+        }
+
+
+class ConcurrencyLimiter:
+    def __init__(self, name, config_key, retry_after=1):
+        self.name = name
+        self.config_key = config_key
+        self.retry_after = retry_after
+        limiters.append(self)
+
+    def _state(self):
+        return _app_state(self, lambda value: _InFlight(int(value)))
+
+    def acquire(self):
+        state = self._state()
+        with state.lock:
+            if state.in_flight >= state.limit:
+                state.rejected += 1
+                return False
+            state.in_flight += 1
+            state.admitted += 1
+            return True
+
+    def release(self):
+        state = self._state()
+        with state.lock:
+            state.in_flight -= 1
+
+    def metrics(self):
+        state = self._state()
+        return {
+            'in_flight': state.in_flight,
+            'admitted': state.admitted,
+            'rejected': state.rejected,
+            'limit': state.limit,
+        }
+
+
+def rate_limit(limiter, key_func):
+    """Reject with 429 when key_func()'s bucket for this limiter is empty."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = key_func()
+            if key is not None:
+                wait = limiter.hit(key)
+                if wait:
+                    return too_many_requests("Too many requests. Please try again later.", wait)
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def limit_concurrency(limiter):
+    """Shed load with 429 when the route already has the limit of requests running."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not limiter.acquire():
+                return too_many_requests("Server is busy. Please try again shortly.", limiter.retry_after)
+            try:
+                return view(*args, **kwargs)
+            finally:
+                limiter.release()
+        return wrapper
+    return decorator
+
+
+def render_metrics():
+    """All registered limiters in the Prometheus text format."""
+    lines = []
+    for limiter in limiters:
+        for metric, value in limiter.metrics().items():
+            lines.append(f'potter_limiter_{metric}{{limiter="{limiter.name}"}} {value}')
+    return "\n".join(lines) + "\n"
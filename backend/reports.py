@@ -0,0 +1,234 @@
+import csv
+import io
+import re
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from functools import partial
+from html import escape
+
+from models import ATTENDANCE_STATUS_CODES
+
+
+###########################################
+##   TERM REPORTS                        ##
+###########################################
+# One report per student: for each class they are enrolled in, every
+# assignment due in the term with their score, plus the attendance tally.
+# Run offline with `flask term-reports`.
+#
+# Each table is read once with a plain columnar query and joined in memory
+# by id, instead of the per-row ORM lookups the API does. Rendering is CPU
+# bound and independent per student, so it runs in a process pool, a chunk
+# of students per task; finished files are written into the zip as the
+# chunks come back, in student id order.
+#
+# A report is a plain tuple so it pickles cheaply to the workers:
+#   (student_id, username, full_name, sections, scores)
+#   sections: [(class_code, [(assignment_id, title, due)], present, absent)]
+#   scores:   {assignment_id: score}, missing for ungraded assignments
+# The assignment lists are shared between students, and pickle sends a
+# shared object once per chunk. Matching scores to assignments is left to
+# the workers.
+
+FORMATS = ('html', 'csv')
+CHUNK_SIZE = 64
+
+PRESENT = ATTENDANCE_STATUS_CODES['present']
+ABSENT = ATTENDANCE_STATUS_CODES['absent']
+
+
+def _term_filter(column, start, end):
+    """SQL condition and params bounding column to [start, end]; dates compare as ISO strings."""
+    conditions, params = [], {}
+    if start is not None:
+        conditions.append(f"{column} >= :start")
+        params['start'] = start.isoformat()
+    if end is not None:
+        conditions.append(f"{column} < :end")
+        params['end'] = (end + timedelta(days=1)).isoformat()
+    return "".join(f" AND {condition}" for condition in conditions), params
+
+
+def _fetch(session, sql, params=None):
+    """All rows as plain tuples, straight from the DB-API cursor.
+
+    Building SQLAlchemy Row objects costs more than the query itself at a
+    million grades. Named :params work as-is with sqlite3.
+    """
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.execute(sql, params or {})
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def load_term(session, start=None, end=None):
+    """Report tuples for every student, ordered by student id.
+
+    start and end are dates (inclusive) bounding assignment due dates and
+    attendance; without them every live assignment and attendance row counts.
+    """
+    students = _fetch(session, "SELECT id, username, full_name FROM user WHERE role = 'student' ORDER BY id")
+
+    class_codes = {}
+    enrolled = defaultdict(list)
+    rows = _fetch(session,
+                  "SELECT sc.student_id, c.id, c.class_code FROM student_class sc "
+                  "JOIN class c ON c.id = sc.class_id WHERE c.deleted_at IS NULL ORDER BY c.class_code")
+    for student_id, class_id, class_code in rows:
+        class_codes[class_id] = class_code
+        enrolled[student_id].append(class_id)
+
+    # one list per class, shared by every report that includes the class
+    due_filter, params = _term_filter('due_date', start, end)
+    assignments = defaultdict(list)
+    rows = _fetch(session,
+                  "SELECT id, class_id, title, due_date FROM assignment "
+                  f"WHERE deleted_at IS NULL{due_filter} ORDER BY class_id, due_date, id", params)
+    for assignment_id, class_id, title, due_date in rows:
+        assignments[class_id].append((assignment_id, title, str(due_date)[:10] if due_date else ''))
+
+    # Scores are only looked up for the assignments above; the filter just
+    # keeps other terms' grades from being read
+    grade_filter = f" WHERE assignment_id IN (SELECT id FROM assignment WHERE deleted_at IS NULL{due_filter})" if due_filter else ""
+    scores = defaultdict(dict)
+    for student_id, assignment_id, score in _fetch(
+            session, f"SELECT student_id, assignment_id, score FROM grade{grade_filter}", params):
+        scores[student_id][assignment_id] = score
+
+    date_filter, params = _term_filter('date', start, end)
+    tally = {}
+    rows = _fetch(session,
+                  "SELECT student_id, class_id, "
+                  f"SUM(status = {PRESENT}), SUM(status = {ABSENT}) FROM attendance "
+                  f"WHERE deleted_at IS NULL{date_filter} GROUP BY student_id, class_id", params)
+    for student_id, class_id, present, absent in rows:
+        tally[(student_id, class_id)] = (present, absent)
+
+    reports = []
+    for student_id, username, full_name in students:
+        sections = [(class_codes[class_id], assignments.get(class_id, []), *tally.get((student_id, class_id), (0, 0)))
+                    for class_id in enrolled.get(student_id, ())]
+        reports.append((student_id, username, full_name, sections, scores.get(student_id, {})))
+    return reports
+
+
+def _average(items, scores):
+    graded = [scores[assignment_id] for assignment_id, _, _ in items if assignment_id in scores]
+    return sum(graded) / len(graded) if graded else None
+
+
+def _format_score(score):
+    return '' if score is None else f"{score:g}"
+
+
+def _format_average(average):
+    return '' if average is None else f"{average:.1f}"
+
+
+def _format_rate(present, absent):
+    total = present + absent
+    return f"{present / total * 100:.0f}%" if total else ''
+
+
+def render_html(report, term):
+    student_id, username, full_name, sections, scores = report
+    out = [
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">",
+        f"<title>{escape(full_name)} - {escape(term)}</title>",
+        "<style>body{font-family:sans-serif}table{border-collapse:collapse;margin-bottom:1em}"
+        "td,th{border:1px solid #ccc;padding:2px 8px;text-align:left}</style></head><body>",
+        f"<h1>{escape(full_name)}</h1>",
+        f"<p>{escape(username)} &middot; {escape(term)}</p>",
+    ]
+    if not sections:
+        out.append("<p>Not enrolled in any class.</p>")
+    overall = []
+    for class_code, items, present, absent in sections:
+        average = _average(items, scores)
+        if average is not None:
+            overall.append(average)
+        out.append(f"<h2>{escape(class_code)}</h2>")
+        out.append(f"<p>Average {_format_average(average) or '-'} &middot; "
+                   f"attendance {present}/{present + absent} {_format_rate(present, absent)}</p>")
+        if items:
+            out.append("<table><tr><th>Assignment</th><th>Due</th><th>Score</th></tr>")
+            for assignment_id, title, due in items:
+                out.append(f"<tr><td>{escape(title)}</td><td>{due}</td><td>{_format_score(scores.get(assignment_id)) or '-'}</td></tr>")
+            out.append("</table>")
+    if overall:
+        out.append(f"<p><strong>Overall average {sum(overall) / len(overall):.1f}</strong></p>")
+    out.append("</body></html>\n")
+    return "\n".join(out)
+
+
+CSV_HEADER = ['student_id', 'username', 'full_name', 'term', 'class_code', 'row', 'title', 'due_date', 'score', 'present', 'absent']
+
+
+def _csv_line(values):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='').writerow(values)
+    return buffer.getvalue()
+
+
+def render_csv(report, term):
+    """Assignment rows, then one summary row per class with the average and attendance."""
+    student_id, username, full_name, sections, scores = report
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    # the student columns repeat on every row; quote them once
+    prefix = _csv_line([student_id, username, full_name, term]) + ','
+    for class_code, items, present, absent in sections:
+        for assignment_id, title, due in items:
+            buffer.write(prefix)
+            writer.writerow((class_code, 'assignment', title, due, _format_score(scores.get(assignment_id)), '', ''))
+        buffer.write(prefix)
+        writer.writerow((class_code, 'class', '', '', _format_average(_average(items, scores)), present, absent))
+    return buffer.getvalue()
+
+
+RENDERERS = {'html': render_html, 'csv': render_csv}
+
+
+def report_name(report, fmt):
+    """Archive member name; the id keeps names unique whatever the username holds."""
+    student_id, username = report[0], report[1]
+    return f"{student_id}-{re.sub(r'[^A-Za-z0-9_.-]', '_', username)}.{fmt}"
+
+
+def render_chunk(fmt, term, chunk):
+    render = RENDERERS[fmt]
+    return [(report_name(report, fmt), render(report, term).encode('utf-8')) for report in chunk]
+
+
+def write_reports(reports, out, fmt='html', term='', workers=None, chunk_size=CHUNK_SIZE):
+    """Render reports into a zip written to out (a path or a binary file, which need not be seekable).
+
+    workers=1 renders in this process; None uses one worker per CPU.
+    Returns the number of reports written.
+    """
+    if fmt not in RENDERERS:
+        raise ValueError(f"Unknown report format '{fmt}'")
+    chunks = [reports[i:i + chunk_size] for i in range(0, len(reports), chunk_size)]
+    render = partial(render_chunk, fmt, term)
+
+    # small text files deflate well even at the fastest level, and the
+    # archive is written in this process, so keep it cheap
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        if workers == 1 or len(chunks) <= 1:
+            return _write_files(archive, map(render, chunks))
+        with ProcessPoolExecutor(workers) as pool:
+            return _write_files(archive, pool.map(render, chunks))
+
+
+def _write_files(archive, rendered_chunks):
+    written = 0
+    for files in rendered_chunks:
+        for name, data in files:
+            archive.writestr(name, data)
+        written += len(files)
+    return written
@@ -0,0 +1,210 @@
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+
+from flask import current_app
+from werkzeug.local import LocalProxy
+
+
+###########################################
+##   IN-MEMORY ROSTER SNAPSHOT           ##
+###########################################
+# Keeps "which classes does this teacher teach" and "which students are in
+# this class" in process memory so the write paths can answer membership
+# questions without a TeacherClass/StudentClass query per request.
+#
+# The snapshot is built with one scan of each link table the first time it
+# is used, and the assign endpoints push their changes into it after they
+# commit. Every app, and so every worker process, has its own copy, so a
+# change made through another process is only picked up when the snapshot
+# is rebuilt, which ensure_loaded() does once it is older than
+# ROSTER_MAX_AGE seconds (the same bound SESSION_CACHE_TTL puts on the
+# session cache). Write paths that authorize with it use verify_teaches(),
+# which rechecks a "no" against the database, so a teacher assigned through
+# another worker is never refused.
+#
+# Enrollments are kept compact: one set of packed (class_id, student_id)
+# integers answers membership in O(1), and the per-class / per-student
+# listings are sorted int arrays rather than sets.
+
+def _pack(class_id, student_id):
+    return (class_id << 32) | student_id
+
+
+def _array_add(index, key, value):
+    members = index.get(key)
+    if members is None:
+        index[key] = array('l', [value])
+        return
+    position = bisect_left(members, value)
+    if position == len(members) or members[position] != value:
+        members.insert(position, value)
+
+
+def _as_id(value):
+    # ids arriving from JSON bodies may be strings; the DB compared them loosely
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+DEFAULT_MAX_AGE = 60
+
+
+class RosterSnapshot:
+    def __init__(self, max_age=DEFAULT_MAX_AGE):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._loaded_at = 0.0
+        self._teacher_classes = {}   # teacher_id -> set(class_id)
+        self._enrolled = set()       # _pack(class_id, student_id)
+        self._class_students = {}    # class_id -> sorted array(student_id)
+        self._student_classes = {}   # student_id -> sorted array(class_id)
+
+    # -- building ---------------------------------------------------------
+
+    def load(self, teacher_pairs, student_pairs):
+        """Replace the snapshot with (teacher_id, class_id) and (student_id, class_id) pairs."""
+        teacher_classes = {}
+        for teacher_id, class_id in teacher_pairs:
+            teacher_classes.setdefault(teacher_id, set()).add(class_id)
+
+        enrolled = {_pack(class_id, student_id) for student_id, class_id in student_pairs}
+        class_students = {}
+        student_classes = {}
+        for key in sorted(enrolled):
+            class_id, student_id = key >> 32, key & 0xFFFFFFFF
+            class_students.setdefault(class_id, []).append(student_id)
+            student_classes.setdefault(student_id, []).append(class_id)
+        class_students = {k: array('l', v) for k, v in class_students.items()}
+        # class ids were visited in ascending order, so these are sorted too
+        student_classes = {k: array('l', v) for k, v in student_classes.items()}
+
+        with self._lock:
+            self._teacher_classes = teacher_classes
+            self._enrolled = enrolled
+            self._class_students = class_students
+            self._student_classes = student_classes
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+
+    def refresh(self, session):
+        """Rebuild from the database with one scan of each link table (deleted classes left out)."""
+        from sqlalchemy import text
+        teacher_pairs = session.execute(text(
+            "SELECT tc.teacher_id, tc.class_id FROM teacher_class tc "
+            "JOIN class c ON c.id = tc.class_id WHERE c.deleted_at IS NULL"
+        )).all()
+        student_pairs = session.execute(text(
+            "SELECT sc.student_id, sc.class_id FROM student_class sc "
+            "JOIN class c ON c.id = sc.class_id WHERE c.deleted_at IS NULL"
+        )).all()
+        self.load(teacher_pairs, student_pairs)
+
+    def ensure_loaded(self, session):
+        """Load on first use, and rebuild once the snapshot is older than max_age seconds."""
+        if not self._loaded or time.monotonic() - self._loaded_at > self.max_age:
+            self.refresh(session)
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded = False
+
+    # -- incremental updates (call after the commit succeeded) ------------
+
+    def add_teacher(self, teacher_id, class_id):
+        teacher_id, class_id = _as_id(teacher_id), _as_id(class_id)
+        with self._lock:
+            self._teacher_classes.setdefault(teacher_id, set()).add(class_id)
+
+    def add_student(self, student_id, class_id):
+        student_id, class_id = _as_id(student_id), _as_id(class_id)
+        with self._lock:
+            self._enrolled.add(_pack(class_id, student_id))
+            _array_add(self._class_students, class_id, student_id)
+            _array_add(self._student_classes, student_id, class_id)
+
+    def remove_class(self, class_id):
+        class_id = _as_id(class_id)
+        with self._lock:
+            for classes in self._teacher_classes.values():
+                classes.discard(class_id)
+            for student_id in self._class_students.pop(class_id, ()):
+                self._enrolled.discard(_pack(class_id, student_id))
+                classes = self._student_classes.get(student_id)
+                if classes is not None and class_id in classes:
+                    classes.remove(class_id)
+
+    # -- lookups ----------------------------------------------------------
+
+    def teaches(self, teacher_id, class_id):
+        return _as_id(class_id) in self._teacher_classes.get(_as_id(teacher_id), ())
+
+    def verify_teaches(self, session, teacher_id, class_id):
+        """teaches(), with a "no" rechecked against the database before it is trusted.
+
+        A link found there was added through another process; it is pulled
+        into this snapshot so the next check is answered from memory.
+        """
+        if self.teaches(teacher_id, class_id):
+            return True
+        teacher_id, class_id = _as_id(teacher_id), _as_id(class_id)
+        if teacher_id is None or class_id is None:
+            return False
+        from sqlalchemy import text
+        found = session.execute(text(
+            "SELECT 1 FROM teacher_class tc JOIN class c ON c.id = tc.class_id "
+            "WHERE tc.teacher_id = :teacher_id AND tc.class_id = :class_id AND c.deleted_at IS NULL"
+        ), {'teacher_id': teacher_id, 'class_id': class_id}).first() is not None
+        if found:
+            self.add_teacher(teacher_id, class_id)
+        return found
+
+    def is_enrolled(self, student_id, class_id):
+        student_id, class_id = _as_id(student_id), _as_id(class_id)
+        if student_id is None or class_id is None:
+            return False
+        return _pack(class_id, student_id) in self._enrolled
+
+    def classes_for_teacher(self, teacher_id):
+        return frozenset(self._teacher_classes.get(_as_id(teacher_id), ()))
+
+    def classes_for_student(self, student_id):
+        return frozenset(self._student_classes.get(_as_id(student_id), ()))
+
+    def students_in_class(self, class_id):
+        return frozenset(self._class_students.get(_as_id(class_id), ()))
+
+    # -- reporting --------------------------------------------------------
+
+    def stats(self):
+        """Entry counts and an approximate memory footprint in bytes."""
+        footprint = sys.getsizeof(self._enrolled)
+        footprint += sum(sys.getsizeof(key) for key in self._enrolled)
+        footprint += sys.getsizeof(self._teacher_classes)
+        for classes in self._teacher_classes.values():
+            footprint += sys.getsizeof(classes)
+        for index in (self._class_students, self._student_classes):
+            footprint += sys.getsizeof(index)
+            footprint += sum(sys.getsizeof(members) for members in index.values())
+        # the int keys of the dicts above are shared with the rows that
+        # reference them elsewhere in the process, so they are not counted
+        return {
+            'teacher_links': sum(len(c) for c in self._teacher_classes.values()),
+            'enrollments': len(self._enrolled),
+            'classes': len(self._class_students),
+            'bytes': footprint,
+        }
+
+
+def init_app(app):
+    """Give app its own snapshot; they are never shared between apps (or databases)."""
+    app.extensions['roster'] = RosterSnapshot(app.config.get('ROSTER_MAX_AGE', DEFAULT_MAX_AGE))
+
+
+# The current app's snapshot, used exactly like a RosterSnapshot
+roster = LocalProxy(lambda: current_app.extensions['roster'])
@@ -0,0 +1,67 @@
+from models import ATTENDANCE_STATUSES, ROLES
+from validation import MAX_ID, Field
+
+
+###########################################
+##   REQUEST BODY SCHEMAS                ##
+###########################################
+
+LOGIN_SCHEMA = {
+    'username': Field('str', required=True, max_length=50),
+    'password': Field('str', required=True, max_length=255),
+}
+
+USER_SCHEMA = {
+    'username': Field('str', required=True, max_length=50),
+    'password': Field('str', required=True, max_length=255),
+    'full_name': Field('str', required=True, max_length=100),
+    'role': Field('str', required=True, choices=ROLES),
+}
+
+USERS_SCHEMA = {
+    'users': Field('list', required=True, max_items=1000, items=USER_SCHEMA),
+}
+
+CLASS_SCHEMA = {
+    'class_code': Field('str', required=True, max_length=10),
+}
+
+ASSIGNMENT_SCHEMA = {
+    'title': Field('str', required=True, max_length=100),
+    'description': Field('str', max_length=10000),
+    'due_date': Field('datetime', required=True),
+    'class_id': Field('int', required=True, min_value=1, max_value=MAX_ID),
+}
+
+# Absent fields are left as they are; title and class_id cannot be cleared
+ASSIGNMENT_UPDATE_SCHEMA = {
+    'title': Field('str', nullable=False, max_length=100),
+    'description': Field('str', max_length=10000),
+    'due_date': Field('datetime'),
+    'class_id': Field('int', nullable=False, min_value=1, max_value=MAX_ID),
+}
+
+ATTENDANCE_SCHEMA = {
+    'class_id': Field('int', required=True, min_value=1, max_value=MAX_ID),
+    'student_id': Field('int', required=True, min_value=1, max_value=MAX_ID),
+    'date': Field('date'),
+    'status': Field('str', required=True, choices=ATTENDANCE_STATUSES),
+}
+
+ATTENDANCE_UPDATE_SCHEMA = {
+    'status': Field('str', required=True, choices=ATTENDANCE_STATUSES),
+}
+
+TEACHER_CLASS_SCHEMA = {
+    'teacher_id': Field('int', required=True, min_value=1, max_value=MAX_ID),
+    'class_id': Field('int', required=True, min_value=1, max_value=MAX_ID),
+}
+
+STUDENT_CLASS_SCHEMA = {
+    'student_id': Field('int', required=True, min_value=1, max_value=MAX_ID),
+    'class_id': Field('int', required=True, min_value=1, max_value=MAX_ID),
+}
+
+REVOKE_SESSIONS_SCHEMA = {
+    'user_id': Field('int', required=True, min_value=1, max_value=MAX_ID),
+}
@@ -0,0 +1,127 @@
+import re
+
+from sqlalchemy import text
+
+
+###########################################
+##   FULL-TEXT SEARCH                    ##
+###########################################
+# search_index is an SQLite FTS5 table over user names, class codes and
+# assignment titles/descriptions. Triggers on the source tables keep it in
+# sync, so every write path (and direct SQL) is covered.
+#
+# The rowid encodes what a hit points at: rowid = source id * 4 + kind.
+# That lets the triggers replace a row by rowid instead of scanning, and
+# lets a hit be returned without joining back to the source table. The
+# unindexed scope column holds what role scoping needs: the role for a
+# user, the class id for a class or an assignment.
+#
+# Soft-deleted classes and assignments (deleted_at set) are kept out of the
+# index: the update triggers only re-insert live rows.
+
+KIND_USER = 1
+KIND_CLASS = 2
+KIND_ASSIGNMENT = 3
+
+SEARCH_INDEX_DDL = [
+    """CREATE VIRTUAL TABLE search_index USING fts5(
+        scope UNINDEXED, title, body,
+        tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')""",
+
+    """CREATE TRIGGER search_user_ai AFTER INSERT ON user BEGIN
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 1, new.role, new.full_name, new.username);
+    END""",
+    """CREATE TRIGGER search_user_au AFTER UPDATE OF username, full_name, role ON user BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 1, new.role, new.full_name, new.username);
+    END""",
+    """CREATE TRIGGER search_user_ad AFTER DELETE ON user BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 1;
+    END""",
+
+    """CREATE TRIGGER search_class_ai AFTER INSERT ON class BEGIN
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 2, new.id, new.class_code, '');
+    END""",
+    """CREATE TRIGGER search_class_au AFTER UPDATE OF class_code, deleted_at ON class BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+        INSERT INTO search_index (rowid, scope, title, body)
+            SELECT new.id * 4 + 2, new.id, new.class_code, '' WHERE new.deleted_at IS NULL;
+    END""",
+    """CREATE TRIGGER search_class_ad AFTER DELETE ON class BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 2;
+    END""",
+
+    """CREATE TRIGGER search_assignment_ai AFTER INSERT ON assignment BEGIN
+        INSERT INTO search_index (rowid, scope, title, body) VALUES (new.id * 4 + 3, new.class_id, new.title, coalesce(new.description, ''));
+    END""",
+    """CREATE TRIGGER search_assignment_au AFTER UPDATE OF title, description, class_id, deleted_at ON assignment BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+        INSERT INTO search_index (rowid, scope, title, body)
+            SELECT new.id * 4 + 3, new.class_id, new.title, coalesce(new.description, '') WHERE new.deleted_at IS NULL;
+    END""",
+    """CREATE TRIGGER search_assignment_ad AFTER DELETE ON assignment BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 4 + 3;
+    END""",
+]
+
+SEARCH_INDEX_BACKFILL = [
+    "INSERT INTO search_index (rowid, scope, title, body) SELECT id * 4 + 1, role, full_name, username FROM user",
+    "INSERT INTO search_index (rowid, scope, title, body) "
+    "SELECT id * 4 + 2, id, class_code, '' FROM class WHERE deleted_at IS NULL",
+    "INSERT INTO search_index (rowid, scope, title, body) "
+    "SELECT id * 4 + 3, class_id, title, coalesce(description, '') FROM assignment WHERE deleted_at IS NULL",
+]
+
+
+def create_search_index(conn):
+    """Create the index and its triggers on a connection and fill it from the current rows."""
+    for statement in SEARCH_INDEX_DDL + SEARCH_INDEX_BACKFILL:
+        conn.execute(text(statement))
+
+
+def build_match_query(q):
+    """Turn free text into an FTS5 query: every word must match, as a prefix."""
+    words = re.findall(r"\w+", q or "")
+    return " ".join(f'"{word}"*' for word in words[:10])
+
+
+def search(session, q, role, class_ids=(), limit=20, offset=0):
+    """Ranked hits for q visible to role; class_ids are a student's classes.
+
+    Returns (hits, has_more).
+    """
+    match = build_match_query(q)
+    if not match:
+        return [], False
+
+    params = {'match': match, 'limit': limit + 1, 'offset': offset}
+    if role == 'admin':
+        scope_filter = ""
+    elif role == 'teacher':
+        # teachers see every class and assignment, and students but not staff
+        scope_filter = f"AND (rowid % 4 != {KIND_USER} OR scope = 'student')"
+    else:
+        if not class_ids:
+            return [], False
+        ids = ", ".join(str(int(class_id)) for class_id in class_ids)
+        scope_filter = f"AND rowid % 4 IN ({KIND_CLASS}, {KIND_ASSIGNMENT}) AND scope IN ({ids})"
+
+    rows = session.execute(text(f"""
+        SELECT rowid, scope, title, body
+        FROM search_index
+        WHERE search_index MATCH :match {scope_filter}
+        ORDER BY bm25(search_index, 0.0, 10.0, 1.0)
+        LIMIT :limit OFFSET :offset
+    """), params).all()
+
+    hits = [_hit(*row) for row in rows[:limit]]
+    return hits, len(rows) > limit
+
+
+def _hit(rowid, scope, title, body):
+    source_id, kind = divmod(rowid, 4)
+    if kind == KIND_USER:
+        return {'type': 'user', 'id': source_id, 'full_name': title, 'username': body, 'role': scope}
+    if kind == KIND_CLASS:
+        return {'type': 'class', 'id': source_id, 'class_code': title}
+    return {'type': 'assignment', 'id': source_id, 'title': title, 'class_id': scope}
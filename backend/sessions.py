@@ -0,0 +1,279 @@
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import OperationalError
+from werkzeug.datastructures import CallbackDict
+
+
+###########################################
+##   SERVER-SIDE SESSIONS                ##
+###########################################
+# The cookie only carries a random session id. The session data lives in a
+# store (the user_session table by default, MemorySessionStore as a local
+# stand-in) behind a small in-process read-through cache, so a request that
+# doesn't change its session costs a dict lookup instead of a signature
+# check plus a DB round trip.
+#
+# Expiry slides with activity, but the new expiry is only written back once
+# every SESSION_TOUCH_INTERVAL, and only on a best-effort basis: a locked
+# database skips the write instead of failing the response. An expired row
+# is never served; `flask sweep-sessions` deletes them in one statement,
+# outside the request path. Cache entries are trusted for SESSION_CACHE_TTL
+# seconds, which bounds how long a session revoked by another worker
+# process can still be used there.
+
+SESSION_DEFAULTS = {
+    'SESSION_IDLE_TIMEOUT': timedelta(hours=2),
+    'SESSION_TOUCH_INTERVAL': timedelta(minutes=1),
+    'SESSION_CACHE_TTL': 30,
+    'SESSION_CACHE_SIZE': 10000,
+}
+
+
+class ServerSession(CallbackDict, SessionMixin):
+    def __init__(self, initial=None, sid=None, new=False, expires_at=None):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.expires_at = expires_at
+        self.loaded_user_id = self.get('_user_id')
+        self.modified = False
+
+
+class MemorySessionStore:
+    """Dict-backed store with the same interface as SQLSessionStore."""
+
+    def __init__(self):
+        self._rows = {}
+        self._lock = threading.Lock()
+
+    def get(self, sid):
+        return self._rows.get(sid)
+
+    def save(self, sid, payload, user_id, expires_at):
+        with self._lock:
+            self._rows[sid] = (payload, user_id, expires_at)
+
+    def touch(self, sid, expires_at):
+        with self._lock:
+            if sid in self._rows:
+                payload, user_id, _ = self._rows[sid]
+                self._rows[sid] = (payload, user_id, expires_at)
+
+    def delete(self, sid):
+        with self._lock:
+            self._rows.pop(sid, None)
+
+    def delete_for_user(self, user_id):
+        with self._lock:
+            doomed = [sid for sid, row in self._rows.items() if row[1] == user_id]
+            for sid in doomed:
+                del self._rows[sid]
+        return doomed
+
+    def delete_expired(self, now):
+        with self._lock:
+            doomed = [sid for sid, row in self._rows.items() if row[2] <= now]
+            for sid in doomed:
+                del self._rows[sid]
+        return len(doomed)
+
+    def active(self, now):
+        return [(sid, row[1], row[2]) for sid, row in self._rows.items() if row[2] > now]
+
+
+class SQLSessionStore:
+    """Store backed by a table with id, user_id, data and expires_at columns."""
+
+    def __init__(self, get_engine, table):
+        self._get_engine = get_engine
+        self.table = table
+
+    def get(self, sid):
+        t = self.table
+        with self._get_engine().connect() as conn:
+            row = conn.execute(select(t.c.data, t.c.user_id, t.c.expires_at).where(t.c.id == sid)).first()
+        return tuple(row) if row else None
+
+    def save(self, sid, payload, user_id, expires_at):
+        t = self.table
+        with self._get_engine().begin() as conn:
+            updated = conn.execute(
+                update(t).where(t.c.id == sid).values(data=payload, user_id=user_id, expires_at=expires_at)
+            ).rowcount
+            if not updated:
+                conn.execute(t.insert().values(id=sid, data=payload, user_id=user_id, expires_at=expires_at))
+
+    def touch(self, sid, expires_at):
+        t = self.table
+        with self._get_engine().begin() as conn:
+            conn.execute(update(t).where(t.c.id == sid).values(expires_at=expires_at))
+
+    def delete(self, sid):
+        t = self.table
+        with self._get_engine().begin() as conn:
+            conn.execute(delete(t).where(t.c.id == sid))
+
+    def delete_for_user(self, user_id):
+        t = self.table
+        with self._get_engine().begin() as conn:
+            sids = conn.execute(select(t.c.id).where(t.c.user_id == user_id)).scalars().all()
+            conn.execute(delete(t).where(t.c.user_id == user_id))
+        return sids
+
+    def delete_expired(self, now):
+        t = self.table
+        with self._get_engine().begin() as conn:
+            return conn.execute(delete(t).where(t.c.expires_at <= now)).rowcount
+
+    def active(self, now):
+        t = self.table
+        with self._get_engine().connect() as conn:
+            rows = conn.execute(
+                select(t.c.id, t.c.user_id, t.c.expires_at).where(t.c.expires_at > now).order_by(t.c.expires_at.desc())
+            ).all()
+        return [tuple(row) for row in rows]
+
+
+class ServerSideSessionInterface(SessionInterface):
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, store):
+        self.store = store
+        self._cache = OrderedDict()   # sid -> (data dict, user_id, expires_at, persisted_expiry, cached_at)
+        self._lock = threading.Lock()
+
+    # -- cache ------------------------------------------------------------
+
+    def _cache_get(self, sid, ttl):
+        with self._lock:
+            entry = self._cache.get(sid)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[4] > ttl:
+                del self._cache[sid]
+                return None
+            self._cache.move_to_end(sid)
+            return entry
+
+    def _cache_put(self, sid, data, user_id, expires_at, persisted_expiry, size):
+        with self._lock:
+            self._cache[sid] = (data, user_id, expires_at, persisted_expiry, time.monotonic())
+            self._cache.move_to_end(sid)
+            while len(self._cache) > size:
+                self._cache.popitem(last=False)
+
+    def _cache_drop(self, *sids):
+        with self._lock:
+            for sid in sids:
+                self._cache.pop(sid, None)
+
+    # -- SessionInterface -------------------------------------------------
+
+    def open_session(self, app, request):
+        config = app.config
+        now = datetime.utcnow()
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if not sid:
+            return ServerSession(sid=self._new_sid(), new=True)
+
+        entry = self._cache_get(sid, config['SESSION_CACHE_TTL'])
+        if entry is None:
+            row = self.store.get(sid)
+            if row is None:
+                return ServerSession(sid=self._new_sid(), new=True)
+            payload, user_id, expires_at = row
+            data = self.serializer.loads(payload)
+            entry = (data, user_id, expires_at, expires_at)
+            self._cache_put(sid, data, user_id, expires_at, expires_at, config['SESSION_CACHE_SIZE'])
+
+        data, expires_at = entry[0], entry[2]
+        if expires_at <= now:
+            self._cache_drop(sid)
+            return ServerSession(sid=self._new_sid(), new=True)
+
+        return ServerSession(dict(data), sid=sid, expires_at=expires_at)
+
+    def save_session(self, app, session, response):
+        config = app.config
+        now = datetime.utcnow()
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if not session.new:
+                self.store.delete(session.sid)
+                self._cache_drop(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        user_id = session.get('_user_id')
+        if not session.new and user_id != session.loaded_user_id:
+            # Logging in or switching users gets a fresh id (no session fixation)
+            self.store.delete(session.sid)
+            self._cache_drop(session.sid)
+            session.sid = self._new_sid()
+            session.new = True
+
+        expires_at = now + config['SESSION_IDLE_TIMEOUT']
+        user_id = int(user_id) if user_id is not None else None
+
+        if session.new or session.modified:
+            data = dict(session)
+            self.store.save(session.sid, self.serializer.dumps(data), user_id, expires_at)
+            self._cache_put(session.sid, data, user_id, expires_at, expires_at, config['SESSION_CACHE_SIZE'])
+        else:
+            entry = self._cache_get(session.sid, config['SESSION_CACHE_TTL'])
+            persisted = entry[3] if entry else session.expires_at
+            # Sliding expiry, but only written back once per touch interval
+            if expires_at - persisted >= config['SESSION_TOUCH_INTERVAL']:
+                try:
+                    self.store.touch(session.sid, expires_at)
+                    persisted = expires_at
+                except OperationalError:
+                    # database busy: the old expiry stands, retried next request
+                    pass
+            if entry:
+                self._cache_put(session.sid, entry[0], user_id, expires_at, persisted, config['SESSION_CACHE_SIZE'])
+            if persisted != expires_at:
+                # the cookie already points at this sid; nothing to resend
+                return
+
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=expires_at,
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+    # -- management -------------------------------------------------------
+
+    def revoke_user(self, user_id):
+        """Drop every session of a user; returns how many were removed."""
+        sids = self.store.delete_for_user(user_id)
+        self._cache_drop(*sids)
+        return len(sids)
+
+    def sweep(self, now=None):
+        removed = self.store.delete_expired(now or datetime.utcnow())
+        with self._lock:
+            self._cache.clear()
+        return removed
+
+    @staticmethod
+    def _new_sid():
+        return secrets.token_urlsafe(32)
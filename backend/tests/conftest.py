@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from extensions import db
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app(config={'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}"},
+                     blueprints=('auth', 'users'), migrations=False)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+@pytest.fixture
+def app_context(app):
+    # Only for tests that call into the app directly: a request made while an
+    # app context is pushed reuses it, and with it Flask-Login's cached user
+    with app.app_context():
+        yield
+        db.session.remove()
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from blueprints.sync import CHANGE_FEEDS
+from changes import InvalidToken, SETTLE_TIME, collect_changes
+from extensions import db
+from models import Assignment, Attendance, Class
+
+T = datetime(2026, 10, 1, 12, 0, 0, 123456)
+NOW = T + timedelta(minutes=1)
+
+pytestmark = pytest.mark.usefixtures('app_context')
+
+
+def add_rows(updated_at=T):
+    classes = [Class(class_code=f"C{i}", updated_at=updated_at) for i in range(3)]
+    db.session.add_all(classes)
+    db.session.flush()
+    db.session.add_all([Assignment(title=f"A{i}", class_id=classes[0].id, updated_at=updated_at) for i in range(3)])
+    db.session.add_all([Attendance(class_id=classes[0].id, student_id=1, status=1, updated_at=updated_at) for _ in range(3)])
+    db.session.commit()
+
+
+def page_through(limit):
+    seen, token, has_more = [], None, True
+    while has_more:
+        changes, token, has_more = collect_changes(CHANGE_FEEDS, token, limit, now=NOW)
+        seen.extend((change['type'], change['id']) for change in changes)
+    return seen, token
+
+
+@pytest.mark.parametrize('limit', [1, 2, 4, 9, 50])
+def test_equal_timestamps_page_in_kind_then_id_order(limit):
+    add_rows()
+    seen, _ = page_through(limit)
+    expected = [(name, row_id) for name in ('class', 'assignment', 'attendance') for row_id in (1, 2, 3)]
+    assert seen == expected
+
+
+def test_resuming_from_last_token_returns_only_newer_rows():
+    add_rows()
+    _, token = page_through(4)
+
+    row = db.session.get(Assignment, 2)
+    row.title = "Renamed"
+    row.updated_at = T + timedelta(seconds=1)
+    db.session.commit()
+
+    changes, next_token, has_more = collect_changes(CHANGE_FEEDS, token, 10, now=NOW)
+    assert [(c['type'], c['id'], c['data']['title']) for c in changes] == [('assignment', 2, "Renamed")]
+    assert not has_more
+    assert collect_changes(CHANGE_FEEDS, next_token, 10, now=NOW)[0] == []
+
+
+def test_rows_inside_settle_time_are_held_back():
+    add_rows(updated_at=NOW - SETTLE_TIME / 2)
+    changes, token, has_more = collect_changes(CHANGE_FEEDS, None, 10, now=NOW)
+    assert changes == [] and token is None and not has_more
+
+    later = collect_changes(CHANGE_FEEDS, None, 10, now=NOW + SETTLE_TIME)[0]
+    assert len(later) == 9
+
+
+def test_tombstones_are_reported_as_deletes():
+    add_rows()
+    row = db.session.get(Class, 3)
+    row.soft_delete()
+    row.updated_at = T + timedelta(seconds=1)
+    db.session.commit()
+
+    changes = collect_changes(CHANGE_FEEDS, None, 50, now=NOW)[0]
+    assert changes[-1] == {'type': 'class', 'id': 3, 'updated_at': row.updated_at.isoformat(), 'op': 'delete'}
+
+
+def test_garbage_token_is_rejected():
+    with pytest.raises(InvalidToken):
+        collect_changes(CHANGE_FEEDS, "not-a-token", 10, now=NOW)
@@ -0,0 +1,78 @@
+import time
+from datetime import timedelta
+
+from extensions import db
+from models import User
+
+
+def add_users(app):
+    with app.app_context():
+        db.session.add_all([
+            User(username='admin', password_hash='secret', full_name='Ad Min', role='admin'),
+            User(username='student', password_hash='secret', full_name='Stu Dent', role='student'),
+        ])
+        db.session.commit()
+
+
+def login(client, username):
+    response = client.post('/api/login', json={'username': username, 'password': 'secret'})
+    assert response.status_code == 200
+    return client.get_cookie('session').value
+
+
+def test_login_rotates_the_session_id(app):
+    add_users(app)
+    client = app.test_client()
+    client.get('/api/profile')
+    client.set_cookie('session', 'attacker-chosen-id')
+
+    first = login(client, 'student')
+    assert first != 'attacker-chosen-id'
+
+    second = login(client, 'admin')
+    assert second != first
+    # the id used before the switch is gone, not just replaced in the cookie
+    client.set_cookie('session', first)
+    assert client.get('/api/profile').status_code == 401
+
+
+def test_revoking_a_user_ends_their_sessions(app):
+    add_users(app)
+    admin, student = app.test_client(), app.test_client()
+    login(admin, 'admin')
+    login(student, 'student')
+    assert student.get('/api/profile').status_code == 200
+
+    response = admin.post('/api/sessions/revoke', json={'user_id': 2})
+    assert response.get_json()['revoked'] == 1
+    # revoked while cached in this process, so the cache must be dropped too
+    assert student.get('/api/profile').status_code == 401
+    assert admin.get('/api/profile').status_code == 200
+
+
+def test_logout_deletes_the_stored_session(app):
+    add_users(app)
+    client = app.test_client()
+    sid = login(client, 'student')
+    client.post('/api/logout')
+
+    with app.app_context():
+        assert app.session_interface.store.get(sid) is None
+
+
+def test_aborted_write_does_not_block_the_session_store(app):
+    add_users(app)
+    # every request is due to write the sliding expiry back
+    app.config['SESSION_TOUCH_INTERVAL'] = timedelta(0)
+    client = app.test_client()
+    login(client, 'admin')
+
+    # the first user is autoflushed by the duplicate check, then the handler aborts
+    users = [{'username': name, 'password': 'secret', 'full_name': 'New User', 'role': 'student'}
+             for name in ('newcomer', 'student')]
+    began = time.perf_counter()
+    response = client.post('/api/create_users', json={'users': users})
+    assert response.status_code == 400
+    # not left waiting on the request's own write lock
+    assert time.perf_counter() - began < 1
+    assert client.get('/api/profile').status_code == 200
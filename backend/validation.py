@@ -0,0 +1,149 @@
+from datetime import date, datetime, timezone
+from functools import wraps
+
+from flask import abort, request
+
+
+###########################################
+##   JSON REQUEST VALIDATION             ##
+###########################################
+# Each write endpoint declares the body it accepts as a dict of Field()s.
+# The schema is compiled into a flat list of checks once, at import time,
+# and @validate_json runs them before the handler, so an oversized or
+# malformed body is turned away before the ORM is touched.
+#
+# Flask caches the parsed body, so handlers keep calling request.get_json()
+# without parsing it a second time.
+
+DEFAULT_MAX_BYTES = 16 * 1024
+# Largest id a body may carry: ids are packed into 32 bits in roster.py and
+# anything past SQLite's 64-bit integers would not even bind
+MAX_ID = 2 ** 31 - 1
+
+
+class Field:
+    def __init__(self, kind, required=False, nullable=True, choices=None, max_length=None,
+                 min_value=None, max_value=None, max_items=None, items=None):
+        self.kind = kind              # 'str', 'int', 'date', 'datetime' or 'list'
+        self.required = required
+        self.nullable = nullable      # False: an explicit null is an error, not "absent"
+        self.choices = choices
+        self.max_length = max_length
+        self.min_value = min_value
+        self.max_value = max_value
+        self.max_items = max_items
+        self.items = items            # schema dict for the elements of a 'list'
+
+
+def parse_timestamp(value):
+    """ISO 8601 string -> naive UTC datetime, the way timestamps are stored."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _is_iso_datetime(value):
+    # the same conversion the handlers do: an offset near the ends of the
+    # range parses, then overflows moving to UTC
+    try:
+        parse_timestamp(value)
+    except (ValueError, OverflowError):
+        return False
+    return True
+
+
+def _is_iso_date(value):
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _compile_field(name, field):
+    checks = []
+    if field.kind == 'str':
+        checks.append((lambda v: isinstance(v, str), "must be a string"))
+    elif field.kind == 'int':
+        # bool is a subclass of int, it is never a valid id
+        checks.append((lambda v: isinstance(v, int) and not isinstance(v, bool), "must be an integer"))
+    elif field.kind == 'datetime':
+        checks.append((lambda v: isinstance(v, str) and _is_iso_datetime(v), "must be an ISO 8601 datetime"))
+    elif field.kind == 'date':
+        checks.append((lambda v: isinstance(v, str) and _is_iso_date(v), "must be an ISO 8601 date"))
+    elif field.kind == 'list':
+        checks.append((lambda v: isinstance(v, list), "must be a list"))
+    else:
+        raise ValueError(f"Unknown field kind '{field.kind}' for '{name}'")
+
+    if field.max_length is not None:
+        checks.append((lambda v: len(v) <= field.max_length, f"must be at most {field.max_length} characters"))
+    if field.min_value is not None:
+        checks.append((lambda v: v >= field.min_value, f"must be at least {field.min_value}"))
+    if field.max_value is not None:
+        checks.append((lambda v: v <= field.max_value, f"must be at most {field.max_value}"))
+    if field.choices is not None:
+        checks.append((lambda v: v in field.choices, f"must be one of {', '.join(field.choices)}"))
+    if field.max_items is not None:
+        checks.append((lambda v: len(v) <= field.max_items, f"must have at most {field.max_items} items"))
+
+    item_validator = compile_schema(field.items) if field.items is not None else None
+
+    def check(value, errors, path):
+        for test, message in checks:
+            if not test(value):
+                errors.append(f"'{path}' {message}")
+                return
+        if item_validator is not None:
+            for index, item in enumerate(value):
+                item_validator(item, errors, f"{path}[{index}]")
+                if len(errors) >= 10:
+                    return
+
+    return check
+
+
+def compile_schema(schema):
+    """Turn a {name: Field} dict into a function(payload, errors, path) that appends error strings."""
+    compiled = [(name, field.required, field.nullable, _compile_field(name, field)) for name, field in schema.items()]
+
+    def validate(payload, errors, path=''):
+        if not isinstance(payload, dict):
+            errors.append(f"'{path or 'body'}' must be a JSON object")
+            return
+        for name, required, nullable, check in compiled:
+            key = f"{path}.{name}" if path else name
+            value = payload.get(name)
+            if value is None:
+                if required:
+                    errors.append(f"'{key}' is required")
+                elif not nullable and name in payload:
+                    errors.append(f"'{key}' must not be null")
+                continue
+            check(value, errors, key)
+
+    return validate
+
+
+def validate_json(schema, max_bytes=DEFAULT_MAX_BYTES):
+    validator = compile_schema(schema)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.content_length is not None and request.content_length > max_bytes:
+                abort(413, {"error": f"Request body too large. Limit is {max_bytes} bytes."})
+
+            data = request.get_json(silent=True)
+            if data is None:
+                abort(400, {"error": "Request body must be valid JSON."})
+
+            errors = []
+            validator(data, errors)
+            if errors:
+                abort(400, {"error": "Invalid request body.", "details": errors})
+
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator